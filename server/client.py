@@ -219,21 +219,26 @@ class PlexAPIClient:
 
         def _sync_inventory() -> List[Dict[str, Any]]:
             section = self.server.library.sectionByID(int(section_id))
+            # Fetch every season in the section in one request and group by
+            # show, rather than show.seasons() + season.episodes() per show
+            # (1 + shows * (1 + seasons) round trips). Season.leafCount is the
+            # episode count Plex already reports on the season itself.
+            episodes_by_show: Dict[Any, Dict[int, int]] = {}
+            for season in section.searchSeasons():
+                if season.seasonNumber > 0:
+                    episodes_by_show.setdefault(season.parentRatingKey, {})[
+                        season.seasonNumber
+                    ] = season.leafCount or 0
+
             results = []
             for show in section.all():
-                seasons = show.seasons()
-                season_numbers = sorted(
-                    s.seasonNumber for s in seasons if s.seasonNumber > 0
-                )
-                episode_count = sum(
-                    len(s.episodes()) for s in seasons if s.seasonNumber > 0
-                )
+                episode_counts = episodes_by_show.get(show.ratingKey, {})
                 results.append({
                     "title": show.title,
                     "year": getattr(show, "year", None),
                     "rating_key": str(show.ratingKey),
-                    "seasons": season_numbers,
-                    "episode_count": episode_count,
+                    "seasons": sorted(episode_counts),
+                    "episode_count": sum(episode_counts.values()),
                 })
             return results
 
@@ -249,7 +254,7 @@ class PlexAPIClient:
                 s.seasonNumber for s in seasons if s.seasonNumber > 0
             )
             episode_counts = {
-                s.seasonNumber: len(s.episodes())
+                s.seasonNumber: s.leafCount or 0
                 for s in seasons
                 if s.seasonNumber > 0
             }
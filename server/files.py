@@ -6,6 +6,7 @@ This module provides safe file operations for the Plex ingest workflow with:
 - Copy, move, rename, and delete operations
 """
 
+import os
 import shutil
 from pathlib import Path
 from typing import Set, List, Union
@@ -59,6 +60,8 @@ class FileManager:
             ext.lower() if ext.startswith('.') else f'.{ext.lower()}'
             for ext in self.allowed_extensions
         }
+        # str.endswith takes a tuple, so the check is one C-level call per path
+        self._extension_suffixes = tuple(self.allowed_extensions)
 
     def is_valid_extension(self, file_path: Union[str, Path]) -> bool:
         """Check if file has a valid extension.
@@ -69,8 +72,9 @@ class FileManager:
         Returns:
             True if extension is valid, False otherwise
         """
-        path = Path(file_path)
-        return path.suffix.lower() in self.allowed_extensions
+        name = os.path.basename(file_path).lower()
+        # A bare ".mkv" is a hidden file with no stem, not a video
+        return name.endswith(self._extension_suffixes) and name not in self.allowed_extensions
 
     def validate_path(
         self,
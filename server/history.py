@@ -8,6 +8,7 @@ This module provides an audit log for tracking file ingest operations with:
 - Statistics
 """
 
+import asyncio
 import json
 import aiosqlite
 from pathlib import Path
@@ -16,6 +17,16 @@ from typing import Optional, List, Dict, Any, Union
 from enum import Enum
 from dataclasses import dataclass, asdict
 
+# Upper bound on records written under a single COMMIT
+WRITE_BATCH_SIZE = 100
+
+_INSERT_RECORD_SQL = """
+    INSERT INTO ingest_records
+    (timestamp, source_path, destination_path, status, tmdb_id,
+     media_type, confidence, metadata, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class IngestStatus(str, Enum):
     """Ingest operation status."""
@@ -55,6 +66,11 @@ class IngestHistory:
         self.db_path = Path(db_path)
         self._db: Optional[aiosqlite.Connection] = None
 
+        # Group commit: add_record calls that arrive while a write is in
+        # flight queue up here and are committed together by the next writer
+        self._pending_writes: List[tuple] = []
+        self._write_lock = asyncio.Lock()
+
     async def initialize(self):
         """Initialize database and create schema if needed."""
         self._db = await aiosqlite.connect(str(self.db_path))
@@ -125,12 +141,7 @@ class IngestHistory:
         timestamp = datetime.now().isoformat()
         metadata_json = json.dumps(metadata) if metadata else None
 
-        cursor = await self._db.execute("""
-            INSERT INTO ingest_records
-            (timestamp, source_path, destination_path, status, tmdb_id,
-             media_type, confidence, metadata, error_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        row = (
             timestamp,
             str(source_path),
             str(destination_path),
@@ -140,10 +151,78 @@ class IngestHistory:
             confidence,
             metadata_json,
             error_message
-        ))
+        )
+        future = asyncio.get_running_loop().create_future()
+        self._pending_writes.append((row, future))
 
-        await self._db.commit()
-        return cursor.lastrowid
+        try:
+            await self._write_lock.acquire()
+        except asyncio.CancelledError:
+            # Withdraw the record; writers skip cancelled entries
+            future.cancel()
+            raise
+        # Once issued, a batch must commit or roll back as a whole even if
+        # this caller is cancelled, so it runs in a shielded task that also
+        # releases the lock when done
+        await asyncio.shield(self._flush_writes(future, self._take_write_batch()))
+
+        return future.result()
+
+    def _take_write_batch(self) -> List[tuple]:
+        """Dequeue up to WRITE_BATCH_SIZE records, dropping withdrawn ones.
+
+        Returns:
+            (row, future) pairs to write in one transaction
+        """
+        pending = [entry for entry in self._pending_writes if not entry[1].cancelled()]
+        batch = pending[:WRITE_BATCH_SIZE]
+        self._pending_writes = pending[WRITE_BATCH_SIZE:]
+        return batch
+
+    async def _flush_writes(self, future: asyncio.Future, batch: List[tuple]):
+        """Write batches until future's record is committed, then release the write lock.
+
+        Args:
+            future: Future of the record the lock holder is waiting on
+            batch: First batch, dequeued while acquiring the lock
+        """
+        try:
+            await self._write_batch(batch)
+            # A backlog longer than WRITE_BATCH_SIZE may not reach this record
+            # in the first batch
+            while not future.done():
+                await self._write_batch(self._take_write_batch())
+        finally:
+            self._write_lock.release()
+
+    async def _write_batch(self, batch: List[tuple]):
+        """Insert queued records and commit them as one transaction.
+
+        Args:
+            batch: (row, future) pairs; each future receives its record ID,
+                or the error if the transaction failed
+        """
+        if not batch:
+            return
+
+        record_ids = []
+        try:
+            for row, _ in batch:
+                cursor = await self._db.execute(_INSERT_RECORD_SQL, row)
+                record_ids.append(cursor.lastrowid)
+            await self._db.commit()
+        except Exception as exc:
+            await self._db.rollback()
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        # A caller cancelled after its batch was issued still has its record
+        # committed; there is just nobody left to hand the ID to
+        for (_, future), record_id in zip(batch, record_ids):
+            if not future.done():
+                future.set_result(record_id)
 
     async def get_record(self, record_id: int) -> Optional[IngestRecord]:
         """Get a record by ID.
@@ -206,8 +285,11 @@ class IngestHistory:
         values.append(record_id)
         query = f"UPDATE ingest_records SET {', '.join(updates)} WHERE id = ?"
 
-        await self._db.execute(query, values)
-        await self._db.commit()
+        # Share the lock with batched inserts so a commit here never lands
+        # in the middle of another writer's open transaction
+        async with self._write_lock:
+            await self._db.execute(query, values)
+            await self._db.commit()
 
     async def get_all_records(self) -> List[IngestRecord]:
         """Get all records.
@@ -137,7 +137,9 @@ async def lifespan(mcp: FastMCP):
     matcher = MediaMatcher(
         tmdb_api_key=tmdb_api_key,
         cache=tmdb_cache,
-        media_root=media_root
+        media_root=media_root,
+        parser=os.getenv("VIDEODROME_FILENAME_PARSER", "guessit").lower(),
+        parse_workers=int(os.getenv("VIDEODROME_PARSE_WORKERS", "0"))
     )
 
     # Initialize FileManager
@@ -226,6 +228,11 @@ async def lifespan(mcp: FastMCP):
     if tmdb_cache:
         await tmdb_cache.close()
 
+    if matcher:
+        matcher.close()
+
+    await discovery_tools.close_scrape_sessions()
+
     logger.info("Videodrome MCP Server shutdown complete.")
 
 
@@ -448,11 +455,15 @@ async def configure_watcher(
 
 
 @mcp.tool()
-async def get_pending_queue() -> list[dict]:
-    """Get pending ingest queue items awaiting review."""
+async def get_pending_queue(min_confidence: Optional[float] = None) -> list[dict]:
+    """Get pending ingest queue items awaiting review.
+
+    Args:
+        min_confidence: Only return items with at least this confidence (0.0-1.0)
+    """
     if not watcher:
         return {"error": "Watcher not configured"}
-    return await watcher.get_pending_queue()
+    return await watcher.get_pending_queue(min_confidence)
 
 
 @mcp.tool()
@@ -666,7 +677,7 @@ async def check_media_volume() -> dict:
     Uses VIDEODROME_NAS_IP, VIDEODROME_NAS_SHARE, and VIDEODROME_NAS_MOUNT_POINT
     from configuration.
     """
-    return await nas_tools.check_media_volume()
+    return nas_tools.check_media_volume()
 
 
 @mcp.tool()
@@ -1,19 +1,84 @@
 """Media matcher using guessit + TMDb pipeline."""
 
-import re
 import asyncio
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 import guessit
 import tmdbsimple as tmdb
 
 from server.tmdb_cache import TMDbCache
+from server.tmdb_executor import TMDB_EXECUTOR
 
 logger = logging.getLogger(__name__)
 
+# Characters that are unsafe in filenames on Windows/SMB shares and macOS
+_FS_SANITIZE = str.maketrans("", "", '<>:"/\\|?*')
+
+# Supported filename parser backends
+FILENAME_PARSERS = ("guessit", "ptn")
+
+# Parsed filenames kept per matcher; the same name is typically parsed by the
+# parse_filename tool, then again by match_media/batch_match
+PARSE_CACHE_MAXSIZE = 512
+
+# PTN result key -> guessit result key
+_PTN_KEY_MAP = {
+    "title": "title",
+    "year": "year",
+    "season": "season",
+    "episode": "episode",
+    "resolution": "screen_size",
+    "quality": "source",
+    "codec": "video_codec",
+    "audio": "audio_codec",
+    "group": "release_group",
+    "container": "container",
+}
+
+
+def _guessit_dict(filename: str) -> Dict[str, Any]:
+    """Parse a filename with guessit and return a plain (picklable) dict."""
+    return dict(guessit.guessit(filename))
+
+
+def _ptn_dict(filename: str) -> Dict[str, Any]:
+    """Parse a filename with parse-torrent-name, mapped to guessit's dict shape."""
+    import PTN  # optional dependency: pip install 'videodrome-plugin[ptn]'
+
+    raw = PTN.parse(filename)
+    result = {
+        key: raw[ptn_key]
+        for ptn_key, key in _PTN_KEY_MAP.items()
+        if raw.get(ptn_key) is not None
+    }
+    result["type"] = "episode" if "season" in result or "episode" in result else "movie"
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _normalize_title(title: Optional[str]) -> str:
+    """Normalize a title for similarity comparison.
+
+    Memoised because confidence scoring compares the same parsed and TMDb
+    titles many times over (e.g. every show against every candidate).
+    """
+    return (title or "").lower().strip()
+
+
+def _title_key(item: Dict[str, Any], *fields: str) -> str:
+    """Return the normalized title from the first populated field."""
+    for field in fields:
+        if item.get(field):
+            return _normalize_title(item[field])
+    return ""
+
 
 class MediaMatcher:
     """Match media files using guessit parsing and TMDb search."""
@@ -22,7 +87,9 @@ class MediaMatcher:
         self,
         tmdb_api_key: str,
         cache: Optional[TMDbCache] = None,
-        media_root: str = "/data/media"
+        media_root: str = "/data/media",
+        parser: str = "guessit",
+        parse_workers: int = 0
     ):
         """Initialize MediaMatcher.
 
@@ -30,24 +97,67 @@ class MediaMatcher:
             tmdb_api_key: TMDb API key
             cache: Optional TMDbCache instance
             media_root: Root path for Plex media libraries
+            parser: Filename parser backend, "guessit" (default) or "ptn"
+            parse_workers: Worker processes for guessit parsing (0 = use the
+                default thread executor)
+
+        Raises:
+            ValueError: If parser is not a supported backend
         """
+        if parser not in FILENAME_PARSERS:
+            raise ValueError(
+                f"Unknown filename parser {parser!r}; expected one of {FILENAME_PARSERS}"
+            )
+
         self.tmdb_api_key = tmdb_api_key
         self.cache = cache
         self.media_root = Path(media_root)
+        # Library folder prefixes are fixed per instance; construct_plex_path
+        # only appends the per-title segments
+        self._movie_dir = f"{self.media_root}/Movies"
+        self._tv_dir = f"{self.media_root}/TV Shows"
+        self.parser = parser
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # guessit parsing is CPU-bound and holds the GIL, so batch_match only
+        # scales across cores when it runs in a process pool
+        self._parse_pool: Optional[ProcessPoolExecutor] = (
+            ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+        )
         tmdb.API_KEY = tmdb_api_key
 
+    def close(self):
+        """Shut down the parser process pool, if one was started."""
+        if self._parse_pool:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
     async def parse_filename(self, filename: str) -> Dict[str, Any]:
-        """Parse filename using guessit.
+        """Parse filename using the configured parser backend.
 
         Args:
             filename: Filename to parse
 
         Returns:
-            Parsed metadata dictionary
+            Parsed metadata dictionary (guessit key names for both backends)
         """
-        # Run guessit in executor since it's CPU-bound
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, guessit.guessit, filename)
+        cached = self._parse_cache.get(filename)
+        if cached is not None:
+            self._parse_cache.move_to_end(filename)
+            return dict(cached)
+
+        if self.parser == "ptn":
+            # PTN is a handful of regexes - cheap enough to run inline
+            result = _ptn_dict(filename)
+        else:
+            # Run guessit in executor since it's CPU-bound
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(self._parse_pool, _guessit_dict, filename)
+
+        # Callers get their own copy so edits can't leak into the cache
+        self._parse_cache[filename] = result
+        if len(self._parse_cache) > PARSE_CACHE_MAXSIZE:
+            self._parse_cache.popitem(last=False)
         return dict(result)
 
     async def search_tmdb(
@@ -77,6 +187,26 @@ class MediaMatcher:
             if cached:
                 return cached if isinstance(cached, list) else [cached]
 
+        # Coalesce concurrent identical lookups (e.g. several releases of the
+        # same film in one batch_match) onto a single TMDb request
+        key = (title.lower(), year, media_type)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._search_tmdb_remote(title, year, media_type, max_retries)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _search_tmdb_remote(
+        self,
+        title: str,
+        year: Optional[int],
+        media_type: str,
+        max_retries: int,
+    ) -> List[Dict[str, Any]]:
+        """Query the TMDb search API with retries and store results in cache."""
         loop = asyncio.get_event_loop()
         search = tmdb.Search()
 
@@ -93,7 +223,7 @@ class MediaMatcher:
         last_error: Optional[Exception] = None
         for attempt in range(1, max_retries + 1):
             try:
-                result = await loop.run_in_executor(None, do_search)
+                result = await loop.run_in_executor(TMDB_EXECUTOR, do_search)
                 break
             except Exception as exc:
                 last_error = exc
@@ -135,9 +265,9 @@ class MediaMatcher:
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        title1_clean = title1.lower().strip()
-        title2_clean = title2.lower().strip()
-        return SequenceMatcher(None, title1_clean, title2_clean).ratio()
+        return SequenceMatcher(
+            None, _normalize_title(title1), _normalize_title(title2)
+        ).ratio()
 
     async def calculate_confidence(
         self,
@@ -162,9 +292,9 @@ class MediaMatcher:
         score = 0.0
 
         # Title similarity (40%)
-        parsed_title = parsed.get("title", "")
-        tmdb_title = tmdb_result.get("title") or tmdb_result.get("name", "")
-        title_sim = await self.calculate_title_similarity(parsed_title, tmdb_title)
+        parsed_title = _title_key(parsed, "title")
+        tmdb_title = _title_key(tmdb_result, "title", "name")
+        title_sim = SequenceMatcher(None, parsed_title, tmdb_title).ratio()
         score += title_sim * 0.40
 
         # Year match (30%)
@@ -210,11 +340,9 @@ class MediaMatcher:
         Returns:
             Sanitized filename
         """
-        # Remove or replace invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-        # Replace multiple spaces with single space
-        filename = re.sub(r'\s+', ' ', filename)
-        return filename.strip()
+        # Drop invalid characters in one pass, then collapse runs of
+        # whitespace to a single space (split/join also strips the ends)
+        return " ".join(filename.translate(_FS_SANITIZE).split())
 
     async def get_episode_title(
         self,
@@ -236,7 +364,7 @@ class MediaMatcher:
             loop = asyncio.get_event_loop()
             tv = tmdb.TV(tv_id)
             ep = tv.season(season).episode(episode)
-            ep_info = await loop.run_in_executor(None, ep.info)
+            ep_info = await loop.run_in_executor(TMDB_EXECUTOR, ep.info)
             return ep_info.get("name", f"Episode {episode}")
         except Exception:
             return f"Episode {episode}"
@@ -264,7 +392,7 @@ class MediaMatcher:
             Plex-compatible path
         """
         # Get extension
-        ext = Path(original_filename).suffix
+        ext = os.path.splitext(original_filename)[1]
 
         media_type = parsed.get("type", "movie")
         tmdb_id = tmdb_result["id"]
@@ -285,18 +413,12 @@ class MediaMatcher:
             episode_title = await self.get_episode_title(tmdb_id, season, episode)
             episode_title = await self.sanitize_filename(episode_title)
 
-            season_str = f"Season {season:02d}"
-            episode_str = f"s{season:02d}e{episode:02d}"
-
-            if year:
-                show_dir = f"{show_name} ({year})"
-                filename = f"{show_name} ({year}) - {episode_str} - {episode_title}{ext}"
-            else:
-                show_dir = show_name
-                filename = f"{show_name} - {episode_str} - {episode_title}{ext}"
+            # The show folder doubles as the filename prefix
+            show_dir = f"{show_name} ({year})" if year else show_name
 
-            return str(
-                self.media_root / "TV Shows" / show_dir / season_str / filename
+            return (
+                f"{self._tv_dir}/{show_dir}/Season {season:02d}/"
+                f"{show_dir} - s{season:02d}e{episode:02d} - {episode_title}{ext}"
             )
         else:
             # Movie path
@@ -307,16 +429,13 @@ class MediaMatcher:
             release_date = tmdb_result.get("release_date", "")
             year = release_date[:4] if release_date else parsed.get("year", "")
 
+            # The movie folder doubles as the filename stem
             if year:
                 movie_dir = f"{movie_name} ({year}) {{tmdb-{tmdb_id}}}"
-                filename = f"{movie_name} ({year}) {{tmdb-{tmdb_id}}}{ext}"
             else:
                 movie_dir = f"{movie_name} {{tmdb-{tmdb_id}}}"
-                filename = f"{movie_name} {{tmdb-{tmdb_id}}}{ext}"
 
-            return str(
-                self.media_root / "Movies" / movie_dir / filename
-            )
+            return f"{self._movie_dir}/{movie_dir}/{movie_dir}{ext}"
 
     async def match_media(self, filename: str) -> Optional[Dict[str, Any]]:
         """Full matching pipeline for a media file.
@@ -369,6 +488,9 @@ class MediaMatcher:
     async def batch_match(self, filenames: List[str]) -> List[Optional[Dict[str, Any]]]:
         """Match multiple files in batch.
 
+        Filenames are matched concurrently; with parse_workers set, guessit
+        parsing is spread across the process pool.
+
         Args:
             filenames: List of filenames to match
 
@@ -6,6 +6,48 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson  # optional: pip install 'videodrome-plugin[speedups]'
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+try:
+    import zstandard  # optional: pip install 'videodrome-plugin[speedups]'
+except ImportError:  # pragma: no cover - exercised when zstandard is absent
+    zstandard = None
+
+# Payloads larger than this are zstd-compressed (full TMDb search pages)
+COMPRESS_THRESHOLD = 4096
+
+# Every zstd frame starts with this magic number
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _encode_result(result: Dict[str, Any] | list) -> str | bytes:
+    """Serialize a result for storage, compressing large payloads.
+
+    Small payloads are stored as JSON text so existing rows and ad-hoc
+    sqlite3 inspection keep working; large ones become a zstd BLOB.
+    """
+    if orjson is not None:
+        data = orjson.dumps(result)
+    else:
+        data = json.dumps(result).encode("utf-8")
+    if zstandard is not None and len(data) > COMPRESS_THRESHOLD:
+        return zstandard.ZstdCompressor().compress(data)
+    return data.decode("utf-8")
+
+
+def _decode_result(raw: str | bytes) -> Dict[str, Any] | list:
+    """Deserialize a stored result written by :func:`_encode_result`."""
+    if isinstance(raw, bytes) and raw[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read compressed cache entries")
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class TMDbCache:
     """SQLite cache for TMDb API results with TTL support."""
@@ -58,7 +100,7 @@ class TMDbCache:
             result: TMDb API result (dict or list)
         """
         title_lower = title.lower()
-        result_json = json.dumps(result)
+        result_json = _encode_result(result)
         created_at = datetime.now().timestamp()
 
         await self._conn.execute("""
@@ -111,7 +153,7 @@ class TMDbCache:
                 await self._conn.commit()
                 return None
 
-        return json.loads(result_json)
+        return _decode_result(result_json)
 
     async def clear(self):
         """Clear all cache entries."""
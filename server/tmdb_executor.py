@@ -0,0 +1,13 @@
+"""Shared thread pool for blocking tmdbsimple calls."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+# tmdbsimple is built on synchronous requests, so every call is pushed onto a
+# worker thread. The loop's default executor is capped at min(32, cpu + 4)
+# workers and is shared with file and scraping work; a dedicated pool sized to
+# TMDb's 40-requests-per-10s budget lets gathered lookups actually overlap.
+TMDB_MAX_WORKERS = 40
+
+TMDB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=TMDB_MAX_WORKERS, thread_name_prefix="tmdb"
+)
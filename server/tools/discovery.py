@@ -1,19 +1,33 @@
 """Discovery tools for finding new seasons and top-rated content."""
 
 import asyncio
+import codecs
 import json
 import logging
 import os
 import re
+import time
 import urllib.parse
 import urllib.request
+import weakref
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional
 
 import tmdbsimple as tmdb
 
+try:
+    import orjson  # optional: pip install 'videodrome-plugin[speedups]'
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+from server.tmdb_executor import TMDB_EXECUTOR
+
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception either way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # ---------------------------------------------------------------------------
 # Newspaper review helpers
 # ---------------------------------------------------------------------------
@@ -21,6 +35,21 @@ logger = logging.getLogger(__name__)
 # Regex to find star ratings in scraped HTML (e.g. "4/5", "4 out of 5", "★★★★")
 _STAR_FRACTION_RE = re.compile(r"(\d)\s*/\s*5")
 _UNICODE_STARS_RE = re.compile(r"(★+)")
+_DATA_RATING_RE = re.compile(r'data-rating=["\'](\d+(?:\.\d+)?)["\']')
+_STARS_CLASS_RE = re.compile(r'class="stars?-(\d)"')
+
+# JSON-LD blocks and <title> on review pages
+_JSONLD_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL,
+)
+_HTML_TITLE_RE = re.compile(r"<title[^>]*>([^<|]+)")
+
+# Review links on Guardian search pages; dated /film/YYYY/… links are preferred
+_GUARDIAN_DATED_FILM_LINK_RE = re.compile(
+    r'href="(https://www\.theguardian\.com/film/\d{4}/[^"]+)"'
+)
+_GUARDIAN_FILM_LINK_RE = re.compile(r'href="(https://www\.theguardian\.com/film/[^"?]+)"')
 
 _SCRAPE_HEADERS = {
     "User-Agent": (
@@ -32,6 +61,40 @@ _SCRAPE_HEADERS = {
 }
 
 
+# One pooled curl-cffi session per event loop, so back-to-back fetches against
+# the same host (Guardian search -> review page) reuse a keep-alive connection
+# instead of paying a fresh TCP + TLS handshake each time.
+_curl_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_curl_session():
+    """Return the shared curl-cffi AsyncSession for the running loop.
+
+    Raises:
+        ImportError: If curl-cffi is not installed.
+    """
+    from curl_cffi.requests import AsyncSession  # type: ignore[import]
+
+    loop = asyncio.get_running_loop()
+    session = _curl_sessions.get(loop)
+    if session is None:
+        session = AsyncSession(max_clients=32)
+        _curl_sessions[loop] = session
+    return session
+
+
+async def close_scrape_sessions() -> None:
+    """Close pooled scraping sessions (call on server shutdown)."""
+    while _curl_sessions:
+        _, session = _curl_sessions.popitem()
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug("Error closing curl-cffi session: %s", e)
+
+
 async def _fetch_url_urllib(url: str) -> Optional[str]:
     """Fetch a URL via urllib (no JS, no cookies — simple fallback)."""
     loop = asyncio.get_event_loop()
@@ -50,7 +113,36 @@ async def _fetch_url_urllib(url: str) -> Optional[str]:
         return None
 
 
-async def _fetch_url_with_browser(url: str) -> Optional[str]:
+async def _curl_stream_until(session, url: str, stop_at: "re.Pattern[str]") -> Optional[str]:
+    """Stream a page via curl-cffi and stop reading once stop_at matches.
+
+    Returns the body received so far (up to and including the matching chunk),
+    the whole body if the pattern never matches, or None on a non-200 status.
+    """
+    resp = await session.get(url, impersonate="chrome131", timeout=10, stream=True)
+    try:
+        if resp.status_code != 200:
+            logger.debug("curl-cffi got %d at %s — escalating to browser", resp.status_code, url)
+            return None
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        chunks: List[str] = []
+        tail = ""
+        async for chunk in resp.aiter_content():
+            text = decoder.decode(chunk)
+            chunks.append(text)
+            # Search with a small overlap so matches spanning chunks are seen
+            window = tail + text
+            if stop_at.search(window):
+                break
+            tail = window[-1024:]
+        return "".join(chunks)
+    finally:
+        await resp.aclose()
+
+
+async def _fetch_url_with_browser(
+    url: str, stop_at: Optional["re.Pattern[str]"] = None
+) -> Optional[str]:
     """Fetch a URL with a tiered bot-resistant approach.
 
     Tier 1 — curl-cffi: fast HTTP with real Chrome TLS/HTTP2 fingerprints; no browser
@@ -61,12 +153,20 @@ async def _fetch_url_with_browser(url: str) -> Optional[str]:
     Tier 3 — crawl4ai standard (stealth plugin): Playwright + playwright-stealth patches;
               used when patchright is not installed.
     Tier 4 — urllib: bare fallback when crawl4ai is absent.
+
+    When stop_at is given, the curl-cffi tier streams the response and stops
+    reading at the first match, so callers that only need an early link (e.g.
+    the first result on a search page) don't download the rest of the page.
+    Browser tiers always return the full rendered page.
     """
     # Tier 1: curl-cffi — TLS fingerprint spoofing, no browser overhead
     try:
-        from curl_cffi.requests import AsyncSession  # type: ignore[import]
-
-        async with AsyncSession() as session:
+        session = _get_curl_session()
+        if stop_at is not None:
+            html = await _curl_stream_until(session, url, stop_at)
+            if html is not None:
+                return html
+        else:
             resp = await session.get(url, impersonate="chrome131", timeout=10)
             if resp.status_code == 200:
                 return resp.text
@@ -129,6 +229,44 @@ async def _fetch_url_with_browser(url: str) -> Optional[str]:
     return await _fetch_url_urllib(url)
 
 
+# ---------------------------------------------------------------------------
+# Review cache
+# ---------------------------------------------------------------------------
+
+# Newspaper reviews are effectively immutable once published, and the same
+# titles recur across discover runs (trending + top-rated overlap heavily).
+# Negative results expire sooner so a transient block doesn't stick all day.
+_REVIEW_CACHE_TTL = 24 * 3600
+_REVIEW_CACHE_NEGATIVE_TTL = 3600
+_REVIEW_CACHE_MAXSIZE = 2048
+
+# (source, normalized title, year) -> (expires_at monotonic, result or None)
+_REVIEW_CACHE: Dict[tuple, tuple] = {}
+
+# Sentinel distinguishing "not cached" from a cached None
+_MISS = object()
+
+
+def _review_cache_get(key: tuple) -> Any:
+    """Return a cached review result, or _MISS if absent or expired."""
+    entry = _REVIEW_CACHE.get(key)
+    if entry is None:
+        return _MISS
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        _REVIEW_CACHE.pop(key, None)
+        return _MISS
+    return value
+
+
+def _review_cache_put(key: tuple, value: Optional[Dict[str, Any]]) -> None:
+    """Cache a review result, evicting the oldest entry when full."""
+    if key not in _REVIEW_CACHE and len(_REVIEW_CACHE) >= _REVIEW_CACHE_MAXSIZE:
+        del _REVIEW_CACHE[next(iter(_REVIEW_CACHE))]
+    ttl = _REVIEW_CACHE_TTL if value is not None else _REVIEW_CACHE_NEGATIVE_TTL
+    _REVIEW_CACHE[key] = (time.monotonic() + ttl, value)
+
+
 def _normalize_review_title(text: str) -> str:
     """Normalize titles for robust equality matching."""
     normalized = re.sub(r"[^a-z0-9]+", " ", text.lower())
@@ -222,7 +360,7 @@ async def _extract_guardian_review_result(
     if score is None:
         return None
 
-    headline_match = re.search(r"<title[^>]*>([^<|]+)", review_html)
+    headline_match = _HTML_TITLE_RE.search(review_html)
     headline = headline_match.group(1).strip() if headline_match else ""
 
     return {
@@ -235,13 +373,9 @@ async def _extract_guardian_review_result(
 
 def _parse_guardian_jsonld(html: str) -> Optional[float]:
     """Extract star rating from Guardian JSON-LD structured data (application/ld+json)."""
-    for match in re.finditer(
-        r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-        html,
-        re.DOTALL,
-    ):
+    for match in _JSONLD_RE.finditer(html):
         try:
-            data = json.loads(match.group(1))
+            data = _json_loads(match.group(1))
             items = data if isinstance(data, list) else [data]
             for item in items:
                 if item.get("@type") == "Review":
@@ -267,9 +401,25 @@ async def _fetch_guardian_review(
         2. If not in RSS (older film), scrape the Guardian search page via browser.
         3. Fetch the review article; extract rating via JSON-LD or HTML patterns.
 
+    Results (including "no review found") are cached per (title, year).
+
     Returns:
         {"score": float (0-10), "url": str, "headline": str, "source": "guardian"} or None.
     """
+    key = ("guardian", _normalize_review_title(title), year)
+    cached = _review_cache_get(key)
+    if cached is not _MISS:
+        return cached
+    result = await _lookup_guardian_review(title, year)
+    _review_cache_put(key, result)
+    return result
+
+
+async def _lookup_guardian_review(
+    title: str,
+    year: Optional[int],
+) -> Optional[Dict[str, Any]]:
+    """Uncached Guardian review lookup backing :func:`_fetch_guardian_review`."""
     # Step 1: RSS lookup — fast, reliable, zero bot-detection risk
     rss_article_url = await _find_guardian_review_url_via_rss(title, year)
     if rss_article_url:
@@ -283,7 +433,8 @@ async def _fetch_guardian_review(
     search_url = (
         f"https://www.theguardian.com/search?q={search_query}&section=film"
     )
-    search_html = await _fetch_url_with_browser(search_url)
+    # Streaming stops at the first dated link, which is the one we prefer
+    search_html = await _fetch_url_with_browser(search_url, stop_at=_GUARDIAN_DATED_FILM_LINK_RE)
     if not search_html or len(search_html) < 500:
         logger.debug(
             "Guardian search blocked for %r — RT/Metacritic already aggregate this source",
@@ -292,15 +443,9 @@ async def _fetch_guardian_review(
         return None
 
     # Extract first review URL — prefer dated /film/YYYY/… links
-    review_match = re.search(
-        r'href="(https://www\.theguardian\.com/film/\d{4}/[^"]+)"',
-        search_html,
-    )
+    review_match = _GUARDIAN_DATED_FILM_LINK_RE.search(search_html)
     if not review_match:
-        review_match = re.search(
-            r'href="(https://www\.theguardian\.com/film/[^"?]+)"',
-            search_html,
-        )
+        review_match = _GUARDIAN_FILM_LINK_RE.search(search_html)
     if not review_match:
         return None
 
@@ -329,9 +474,22 @@ async def _fetch_telegraph_review(
 
     Note: RT/Metacritic already aggregate Telegraph reviews, so this is supplementary.
 
+    Results (including "no review found") are cached per (title, year).
+
     Returns:
         {"score": float (0-10), "url": str, "source": "telegraph"} or None.
     """
+    key = ("telegraph", _normalize_review_title(title), year)
+    cached = _review_cache_get(key)
+    if cached is not _MISS:
+        return cached
+    result = await _lookup_telegraph_review(title)
+    _review_cache_put(key, result)
+    return result
+
+
+async def _lookup_telegraph_review(title: str) -> Optional[Dict[str, Any]]:
+    """Uncached Telegraph review lookup backing :func:`_fetch_telegraph_review`."""
     search_query = urllib.parse.quote_plus(f"{title} review")
     search_url = (
         f"https://www.telegraph.co.uk/search/?queryText={search_query}&contentType=article"
@@ -366,7 +524,7 @@ def _parse_star_rating_from_html(html: str) -> Optional[float]:
         - data-rating="4" or class="stars-4"
     """
     # data-rating attribute (common CMS pattern)
-    m = re.search(r'data-rating=["\'](\d+(?:\.\d+)?)["\']', html)
+    m = _DATA_RATING_RE.search(html)
     if m:
         try:
             return min(float(m.group(1)) / 5.0 * 10.0, 10.0)
@@ -390,7 +548,7 @@ def _parse_star_rating_from_html(html: str) -> Optional[float]:
             return count / 5.0 * 10.0
 
     # "class="star-N"" or "stars-N"
-    m = re.search(r'class="stars?-(\d)"', html)
+    m = _STARS_CLASS_RE.search(html)
     if m:
         try:
             return float(m.group(1)) / 5.0 * 10.0
@@ -440,7 +598,7 @@ async def _fetch_tmdb_tv_details(tv_id: int, loop) -> Optional[Dict[str, Any]]:
     """Fetch full TMDb TV details for reliable season metadata."""
     try:
         tv = tmdb.TV(tv_id)
-        result = await loop.run_in_executor(None, tv.info)
+        result = await loop.run_in_executor(TMDB_EXECUTOR, tv.info)
         return result if isinstance(result, dict) else None
     except Exception as e:
         logger.debug("TMDb TV details fetch failed for id=%s: %s", tv_id, e)
@@ -506,6 +664,7 @@ async def find_new_seasons(
     shows_with_new_seasons = []
     up_to_date = 0
     failed_lookups = []
+    tv_details_cache: Dict[int, Optional[Dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     # Step 3: Compare each show against TMDb
@@ -513,7 +672,8 @@ async def find_new_seasons(
     for show in inventory:
         title = show["title"]
         year = show.get("year")
-        plex_seasons = set(show.get("seasons", []))
+        # Specials (season 0) are excluded on both sides of the set difference
+        plex_seasons = {s for s in show.get("seasons", []) if s > 0}
 
         try:
             tmdb_results = await matcher.search_tmdb(
@@ -552,8 +712,14 @@ async def find_new_seasons(
             })
             continue
 
-        needs_details = not best.get("seasons")
-        details = await _fetch_tmdb_tv_details(int(tmdb_id), loop) if needs_details else None
+        # Only pay for a TV details round-trip when the search payload lacks
+        # season data; results are reused for duplicate shows in this call.
+        details = None
+        if not best.get("seasons"):
+            tv_id = int(tmdb_id)
+            if tv_id not in tv_details_cache:
+                tv_details_cache[tv_id] = await _fetch_tmdb_tv_details(tv_id, loop)
+            details = tv_details_cache[tv_id]
         season_source = details or best
         tmdb_seasons_raw = season_source.get("seasons", [])
 
@@ -677,7 +843,7 @@ async def discover_top_rated_content(
         """Fetch weekly trending from TMDb."""
         try:
             trending = tmdb.Trending(media_type=media, time_window="week")
-            result = await loop.run_in_executor(None, trending.info)
+            result = await loop.run_in_executor(TMDB_EXECUTOR, trending.info)
             return result.get("results", [])
         except Exception as e:
             logger.warning("TMDb trending fetch failed for %s: %s", media, e)
@@ -688,10 +854,10 @@ async def discover_top_rated_content(
         try:
             if media == "movie":
                 obj = tmdb.Movies()
-                result = await loop.run_in_executor(None, obj.top_rated)
+                result = await loop.run_in_executor(TMDB_EXECUTOR, obj.top_rated)
             else:
                 obj = tmdb.TV()
-                result = await loop.run_in_executor(None, obj.top_rated)
+                result = await loop.run_in_executor(TMDB_EXECUTOR, obj.top_rated)
             return result.get("results", [])
         except Exception as e:
             logger.warning("TMDb top_rated fetch failed for %s: %s", media, e)
@@ -728,11 +894,13 @@ async def discover_top_rated_content(
     # ------------------------------------------------------------------
     genre_map: Dict[int, str] = {}
     try:
-        movie_genres = await loop.run_in_executor(
-            None, lambda: tmdb.Genres().movie_list().get("genres", [])
-        )
-        tv_genres = await loop.run_in_executor(
-            None, lambda: tmdb.Genres().tv_list().get("genres", [])
+        movie_genres, tv_genres = await asyncio.gather(
+            loop.run_in_executor(
+                TMDB_EXECUTOR, lambda: tmdb.Genres().movie_list().get("genres", [])
+            ),
+            loop.run_in_executor(
+                TMDB_EXECUTOR, lambda: tmdb.Genres().tv_list().get("genres", [])
+            ),
         )
         for g in movie_genres + tv_genres:
             genre_map[g["id"]] = g["name"]
@@ -744,22 +912,27 @@ async def discover_top_rated_content(
     # ------------------------------------------------------------------
     recommendations = []
 
-    for item in unique_candidates:
-        media = item["_media_type"]
-        tmdb_rating = item.get("vote_average", 0.0)
-        vote_count = item.get("vote_count", 0)
+    # Cheap pre-filter over the raw payload so only viable candidates reach
+    # the scoring loop. Without OMDb the composite score *is* the TMDb rating,
+    # so min_rating can be applied here too; with OMDb it must wait until the
+    # composite has been computed.
+    start, end = year_range if year_range else (None, None)
+    prefilter_rating = min_rating if not omdb_key else None
+    wanted_genres = {g.lower() for g in genres} if genres else None
 
+    shortlist = []
+    for item in unique_candidates:
         # Skip items with too few votes (unreliable rating)
-        if vote_count < 50:
+        if item.get("vote_count", 0) < 50:
+            continue
+        if prefilter_rating is not None and round(item.get("vote_average", 0.0), 2) < prefilter_rating:
             continue
 
-        title = item.get("title") or item.get("name", "")
         release_date = item.get("release_date") or item.get("first_air_date", "")
         year = int(release_date[:4]) if release_date and len(release_date) >= 4 else None
 
         # Year range filter
         if year_range:
-            start, end = year_range
             if year is None:
                 continue
             if start is not None and year < start:
@@ -768,11 +941,16 @@ async def discover_top_rated_content(
                 continue
 
         # Genre filter
-        item_genre_ids = item.get("genre_ids", [])
-        item_genre_names = [genre_map.get(gid, "") for gid in item_genre_ids]
-        if genres:
-            if not any(g.lower() in [ig.lower() for ig in item_genre_names] for g in genres):
-                continue
+        item_genre_names = [genre_map.get(gid, "") for gid in item.get("genre_ids", [])]
+        if wanted_genres and wanted_genres.isdisjoint(ig.lower() for ig in item_genre_names):
+            continue
+
+        shortlist.append((item, year, item_genre_names))
+
+    for item, year, item_genre_names in shortlist:
+        media = item["_media_type"]
+        tmdb_rating = item.get("vote_average", 0.0)
+        title = item.get("title") or item.get("name", "")
 
         # Composite score (TMDb only unless OMDb enriches)
         composite = tmdb_rating
@@ -50,9 +50,11 @@ class IngestTools:
         """Close history database connection."""
         await self.history.close()
 
-    async def _ensure_auto_mount(self, path: Union[str, Path]) -> None:
+    async def _ensure_auto_mount(
+        self, nas: nas_tools.NasMountSession, path: Union[str, Path]
+    ) -> None:
         """Attempt NAS auto-mount when enabled and path is on the configured volume."""
-        mount_result = await nas_tools.ensure_media_volume_for_path(path)
+        mount_result = await nas.ensure(path)
         if mount_result.get("attempted") and not mount_result.get("success", False):
             raise FileOperationError(
                 f"Auto-mount failed for {path}: {mount_result.get('error', 'unknown error')}"
@@ -71,7 +73,8 @@ class IngestTools:
             Dictionary with success status and list of file paths
         """
         try:
-            await self._ensure_auto_mount(self.file_manager.ingest_dir)
+            async with nas_tools.NasMountSession() as nas:
+                await self._ensure_auto_mount(nas, self.file_manager.ingest_dir)
             files = self.file_manager.list_files(
                 self.file_manager.ingest_dir,
                 recursive=recursive
@@ -127,8 +130,9 @@ class IngestTools:
         )
 
         try:
-            await self._ensure_auto_mount(source)
-            await self._ensure_auto_mount(dest)
+            async with nas_tools.NasMountSession() as nas:
+                await self._ensure_auto_mount(nas, source)
+                await self._ensure_auto_mount(nas, dest)
 
             # Perform file operation
             if operation == "copy":
@@ -1,11 +1,13 @@
 """NAS volume mount management tools for videodrome MCP."""
 
+import asyncio
 import os
 import platform
-import subprocess
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -16,25 +18,41 @@ _NAS_MOUNT_KEY = "VIDEODROME_NAS_MOUNT_POINT"
 _NAS_AUTO_MOUNT_KEY = "VIDEODROME_NAS_AUTO_MOUNT"
 
 
-def _get_nas_config() -> Dict[str, str]:
-    """Read NAS config from environment variables."""
-    return {
-        "nas_ip": os.environ.get(_NAS_IP_KEY, ""),
-        "share_name": os.environ.get(_NAS_SHARE_KEY, "MEDIA"),
-        "mount_point": os.environ.get(_NAS_MOUNT_KEY, "/Volumes/MEDIA"),
-    }
+@dataclass(frozen=True, slots=True)
+class NasConfig:
+    """NAS mount settings resolved from the environment."""
+
+    nas_ip: str
+    share_name: str
+    mount_point: Path
+    auto_mount: bool
 
 
 def _is_truthy(value: str) -> bool:
     return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
 
 
+@lru_cache(maxsize=1)
+def load_nas_config() -> NasConfig:
+    """Read NAS config from environment variables.
+
+    The environment is read once per process; call ``load_nas_config.cache_clear()``
+    after changing the NAS variables (tests do this automatically).
+    """
+    return NasConfig(
+        nas_ip=os.environ.get(_NAS_IP_KEY, ""),
+        share_name=os.environ.get(_NAS_SHARE_KEY, "MEDIA"),
+        mount_point=Path(os.environ.get(_NAS_MOUNT_KEY, "/Volumes/MEDIA")),
+        auto_mount=_is_truthy(os.environ.get(_NAS_AUTO_MOUNT_KEY, "false")),
+    )
+
+
 def is_auto_mount_enabled() -> bool:
     """Whether automatic NAS mount attempts are enabled by configuration."""
-    return _is_truthy(os.environ.get(_NAS_AUTO_MOUNT_KEY, "false"))
+    return load_nas_config().auto_mount
 
 
-async def check_media_volume() -> Dict[str, Any]:
+def check_media_volume(config: Optional[NasConfig] = None) -> Dict[str, Any]:
     """Check if the NAS MEDIA volume is currently mounted and accessible.
 
     Reads NAS configuration from environment variables:
@@ -45,8 +63,8 @@ async def check_media_volume() -> Dict[str, Any]:
     Returns:
         Dictionary with mount status, path, accessibility, and NAS details.
     """
-    cfg = _get_nas_config()
-    mount_point = Path(cfg["mount_point"])
+    cfg = config or load_nas_config()
+    mount_point = cfg.mount_point
 
     mounted = mount_point.exists()
     accessible = False
@@ -62,47 +80,113 @@ async def check_media_volume() -> Dict[str, Any]:
         "mounted": mounted,
         "accessible": accessible,
         "path": str(mount_point),
-        "nas_ip": cfg["nas_ip"],
-        "share_name": cfg["share_name"],
-        "auto_mount_enabled": is_auto_mount_enabled(),
+        "nas_ip": cfg.nas_ip,
+        "share_name": cfg.share_name,
+        "auto_mount_enabled": cfg.auto_mount,
     }
 
     if not mounted:
         result["hint"] = (
-            f"Run mount_media_volume() to mount //{cfg['nas_ip']}/{cfg['share_name']} "
-            f"at {cfg['mount_point']}"
+            f"Run mount_media_volume() to mount //{cfg.nas_ip}/{cfg.share_name} "
+            f"at {mount_point}"
         )
 
     return result
 
 
-async def ensure_media_volume_for_path(path: str | Path) -> Dict[str, Any]:
-    """Auto-mount the configured NAS volume when path access requires it."""
-    cfg = _get_nas_config()
-    mount_point = Path(cfg["mount_point"])
-    target_path = Path(path)
+class NasMountSession:
+    """Check the NAS mount once for a batch of file operations.
 
-    if not is_auto_mount_enabled():
-        return {"attempted": False, "reason": "auto_mount_disabled"}
+    Configuration and mount state are resolved on entry, so ensuring many
+    paths costs one env read and one mount probe rather than one per path::
 
-    try:
-        target_path.resolve(strict=False).relative_to(mount_point.resolve(strict=False))
-    except ValueError:
-        return {"attempted": False, "reason": "path_outside_mount_point"}
+        async with NasMountSession() as nas:
+            for path in paths:
+                await nas.ensure(path)
+
+    A mount performed by the session is left in place on exit.
+    """
+
+    def __init__(self, config: Optional[NasConfig] = None):
+        self.config = config
+
+    async def __aenter__(self) -> "NasMountSession":
+        self.config = self.config or load_nas_config()
+        self.auto_mount = self.config.auto_mount
+        self.mount_point = self.config.mount_point.resolve(strict=False)
+        self.mounted = self.auto_mount and _is_mount_accessible(self.mount_point)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def ensure(self, path: str | Path) -> Dict[str, Any]:
+        """Auto-mount the configured NAS volume when access to path requires it."""
+        if not self.auto_mount:
+            return {"attempted": False, "reason": "auto_mount_disabled"}
 
-    if mount_point.exists():
         try:
-            next(mount_point.iterdir(), None)
+            Path(path).resolve(strict=False).relative_to(self.mount_point)
+        except ValueError:
+            return {"attempted": False, "reason": "path_outside_mount_point"}
+
+        if self.mounted:
             return {"attempted": False, "reason": "already_mounted"}
-        except (PermissionError, OSError):
-            # Stale mount or inaccessible path; continue to mount attempt.
-            pass
 
-    mount_result = await mount_media_volume(force_remount=False)
-    return {"attempted": True, **mount_result}
+        mount_result = await mount_media_volume(force_remount=False, config=self.config)
+        self.mounted = bool(mount_result.get("success"))
+        return {"attempted": True, **mount_result}
+
+
+def _is_mount_accessible(mount_point: Path) -> bool:
+    """Whether mount_point exists and its root can be listed."""
+    if not mount_point.exists():
+        return False
+    try:
+        next(mount_point.iterdir(), None)
+        return True
+    except (PermissionError, OSError):
+        # Stale mount or inaccessible path
+        return False
+
 
+async def ensure_media_volume_for_path(
+    path: str | Path, config: Optional[NasConfig] = None
+) -> Dict[str, Any]:
+    """Auto-mount the configured NAS volume when path access requires it.
 
-async def mount_media_volume(force_remount: bool = False) -> Dict[str, Any]:
+    For more than one path, use :class:`NasMountSession` directly.
+    """
+    async with NasMountSession(config) as nas:
+        return await nas.ensure(path)
+
+
+async def _run_mount_command(*args: str, timeout: float) -> Tuple[int, str]:
+    """Run a mount command without blocking the event loop.
+
+    Returns:
+        Tuple of (returncode, decoded stderr).
+
+    Raises:
+        asyncio.TimeoutError: If the command does not finish within ``timeout``.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, (stderr or b"").decode(errors="replace")
+
+
+async def mount_media_volume(
+    force_remount: bool = False, config: Optional[NasConfig] = None
+) -> Dict[str, Any]:
     """Mount the NAS MEDIA SMB share.
 
     Uses platform-appropriate mounting:
@@ -111,13 +195,14 @@ async def mount_media_volume(force_remount: bool = False) -> Dict[str, Any]:
 
     Args:
         force_remount: If True, unmount first even if already mounted (macOS only).
+        config: NAS settings (defaults to :func:`load_nas_config`).
 
     Returns:
         Dictionary with success status and mount path.
     """
-    cfg = _get_nas_config()
+    cfg = config or load_nas_config()
 
-    if not cfg["nas_ip"]:
+    if not cfg.nas_ip:
         return {
             "success": False,
             "error": (
@@ -126,62 +211,50 @@ async def mount_media_volume(force_remount: bool = False) -> Dict[str, Any]:
             ),
         }
 
-    mount_point = Path(cfg["mount_point"])
-    nas_ip = cfg["nas_ip"]
-    share_name = cfg["share_name"]
+    mount_point = cfg.mount_point
+    nas_ip = cfg.nas_ip
+    share_name = cfg.share_name
     smb_url = f"smb://{nas_ip}/{share_name}"
 
-    # Check if already mounted
-    if mount_point.exists() and not force_remount:
-        try:
-            next(mount_point.iterdir(), None)
-            return {
-                "success": True,
-                "mounted": True,
-                "path": str(mount_point),
-                "message": f"Volume already mounted at {mount_point}",
-            }
-        except (PermissionError, OSError):
-            pass  # Stale mount — fall through to remount
+    # Check if already mounted (a stale mount falls through to remount)
+    if not force_remount and _is_mount_accessible(mount_point):
+        return {
+            "success": True,
+            "mounted": True,
+            "path": str(mount_point),
+            "message": f"Volume already mounted at {mount_point}",
+        }
 
     system = platform.system()
 
     try:
         if system == "Darwin":
             # macOS: use 'open' to trigger Finder/SMB mount with user credentials
-            result = subprocess.run(
-                ["open", smb_url],
-                capture_output=True,
-                text=True,
-                timeout=15,
+            returncode, stderr = await _run_mount_command(
+                "open", smb_url, timeout=15
             )
-            if result.returncode != 0:
+            if returncode != 0:
                 return {
                     "success": False,
-                    "error": f"mount failed: {result.stderr.strip() or 'unknown error'}",
+                    "error": f"mount failed: {stderr.strip() or 'unknown error'}",
                     "command": f"open {smb_url}",
                 }
             # Give the system a moment to complete the mount
-            import asyncio
             await asyncio.sleep(2)
         elif system == "Linux":
             # Linux: use mount with cifs
             mount_point.mkdir(parents=True, exist_ok=True)
-            result = subprocess.run(
-                [
-                    "mount", "-t", "cifs",
-                    f"//{nas_ip}/{share_name}",
-                    str(mount_point),
-                    "-o", f"username={os.environ.get('USER', 'guest')}",
-                ],
-                capture_output=True,
-                text=True,
+            returncode, stderr = await _run_mount_command(
+                "mount", "-t", "cifs",
+                f"//{nas_ip}/{share_name}",
+                str(mount_point),
+                "-o", f"username={os.environ.get('USER', 'guest')}",
                 timeout=30,
             )
-            if result.returncode != 0:
+            if returncode != 0:
                 return {
                     "success": False,
-                    "error": f"mount failed: {result.stderr.strip() or 'unknown error'}",
+                    "error": f"mount failed: {stderr.strip() or 'unknown error'}",
                 }
         else:
             return {
@@ -204,7 +277,7 @@ async def mount_media_volume(force_remount: bool = False) -> Dict[str, Any]:
                          f"Check NAS credentials and share name.",
             }
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {
             "success": False,
             "error": f"Mount timed out connecting to {nas_ip}. Check network connectivity.",
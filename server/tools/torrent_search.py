@@ -1,8 +1,14 @@
 """Torrent search tool functions for videodrome MCP."""
 
+import asyncio
+import logging
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-from server.torrent_search import TorrentSearchClient
+from server.torrent_search import TorrentSearchClient, _pack_bonus
+
+logger = logging.getLogger(__name__)
 
 _UNAVAILABLE = {"error": "Torrent search not available (torrent-search-mcp not installed). "
                          "Run: pip install 'torrent-search-mcp>=1.1.0' && playwright install --with-deps chromium"}
@@ -71,8 +77,42 @@ _LANGUAGE_ALIASES: Dict[str, str] = {
 }
 
 
+# Query-building tables derived once from _LANGUAGE_CONFIG. Only the top two
+# keywords are used to keep result counts manageable, and a native season word
+# substitution is only recorded when it differs from the English "Season".
+_LANG_KEYWORDS: Dict[str, tuple] = {
+    code: tuple(cfg["keywords"][:2]) for code, cfg in _LANGUAGE_CONFIG.items()
+}
+_LANG_SEASON_SUB: Dict[str, str] = {
+    code: f"{cfg['season_word']} \\1"
+    for code, cfg in _LANGUAGE_CONFIG.items()
+    if cfg.get("season_word") and cfg["season_word"].lower() != "season"
+}
+_SEASON_RE = re.compile(r"\bSeason\s+(\d+)\b", re.IGNORECASE)
+# One alternation per language over its release patterns, matched as whole
+# tokens so short tags such as "GER"/"ITA" do not fire inside "Tiger"/"Vita".
+# Release names separate tokens with dots, spaces, dashes or underscores.
+_LANG_TAG_RE: Dict[str, "re.Pattern[str]"] = {
+    code: re.compile(
+        r"(?<![a-z0-9])(?:"
+        + "|".join(sorted(
+            {re.escape(p.casefold()) for p in cfg["release_patterns"]},
+            key=lambda p: (-len(p), p),
+        ))
+        + r")(?![a-z0-9])",
+        re.IGNORECASE,
+    )
+    for code, cfg in _LANGUAGE_CONFIG.items()
+    if cfg.get("release_patterns")
+}
+
+
+@lru_cache(maxsize=64)
 def _resolve_language(lang: Optional[str]) -> Optional[str]:
-    """Normalise a language name or code to a lowercase ISO code, or None for English."""
+    """Normalise a language name or code to a lowercase ISO code, or None for English.
+
+    Pure and called on every search, so results are memoised per input string.
+    """
     if not lang:
         return None
     code = _LANGUAGE_ALIASES.get(lang.lower().strip())
@@ -93,37 +133,19 @@ def _build_language_queries(
 
     Returns the original queries plus language-augmented ones (deduplicated).
     """
-    cfg = _LANGUAGE_CONFIG.get(lang_code, {})
-    keywords = cfg.get("keywords", [])
-    season_word = cfg.get("season_word", "")
-
-    extra: List[str] = []
-    for q in base_queries:
-        for kw in keywords[:2]:  # top 2 keywords to keep result count manageable
-            extra.append(f"{q} {kw}")
-
-    # If season_word differs from "Season", add a native-language variant
-    if season_word and season_word.lower() != "season":
-        # Replace "Season N" with the native equivalent if present
+    keywords = _LANG_KEYWORDS.get(lang_code, ())
+    extra = [f"{q} {kw}" for q in base_queries for kw in keywords]
+
+    # Replace "Season N" with the native equivalent if present
+    season_sub = _LANG_SEASON_SUB.get(lang_code)
+    if season_sub:
         for q in base_queries:
-            native_q = q
-            import re
-            native_q = re.sub(
-                r"\bSeason\s+(\d+)\b",
-                lambda m: f"{season_word} {m.group(1)}",
-                native_q,
-                flags=re.IGNORECASE,
-            )
-            if native_q != q:
+            native_q, count = _SEASON_RE.subn(season_sub, q)
+            if count:
                 extra.append(native_q)
 
-    seen = set(base_queries)
-    result = list(base_queries)
-    for q in extra:
-        if q not in seen:
-            seen.add(q)
-            result.append(q)
-    return result
+    # dict.fromkeys keeps first-seen order while dropping duplicates
+    return list(dict.fromkeys([*base_queries, *extra]))
 
 
 def _rank_with_language(
@@ -134,24 +156,48 @@ def _rank_with_language(
     Rank results, with an additional bonus for language-matching titles when
     a specific language is requested.
     """
-    cfg = _LANGUAGE_CONFIG.get(lang_code or "", {})
-    release_patterns = [p.lower() for p in cfg.get("release_patterns", [])]
+    tag_re = _LANG_TAG_RE.get(lang_code) if lang_code else None
 
     def _score(r: Dict[str, Any]) -> int:
-        title_lower = r["title"].lower()
-        # Pack bonus (inherited from TorrentSearchClient.rank)
-        pack_bonus = 1000 if any(
-            kw in title_lower for kw in ("complete", "season", " pack", "collection")
-        ) else 0
+        title = r["title"]
         # Language match bonus — strongly prefer language-tagged releases
-        lang_bonus = 2000 if lang_code and any(
-            pat in title_lower for pat in release_patterns
-        ) else 0
-        return lang_bonus + pack_bonus + r.get("seeders", 0)
+        lang_bonus = 2000 if tag_re is not None and tag_re.search(title) else 0
+        return lang_bonus + _pack_bonus(title.casefold()) + r.get("seeders", 0)
 
     return sorted(results, key=_score, reverse=True)
 
 
+async def _search_all(
+    client: TorrentSearchClient,
+    queries: List[str],
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """Run all query variants concurrently and merge results, deduplicated by id.
+
+    A failing variant is logged and skipped; the error is only raised when
+    every query failed.
+    """
+    batches = await asyncio.gather(
+        *(client.search(q, limit=limit) for q in queries), return_exceptions=True
+    )
+
+    seen: Dict[str, Dict[str, Any]] = {}
+    errors = []
+    # gather preserves submission order, so earlier (higher-priority) queries
+    # keep their first-seen copy of a result
+    for q, batch in zip(queries, batches):
+        if isinstance(batch, BaseException):
+            logger.warning("Torrent search failed for %r: %s", q, batch)
+            errors.append(batch)
+            continue
+        for r in batch:
+            seen.setdefault(r["id"], r)
+
+    if errors and len(errors) == len(queries):
+        raise errors[0]
+    return list(seen.values())
+
+
 async def search_torrents(
     client: TorrentSearchClient,
     query: str,
@@ -174,19 +220,14 @@ async def search_torrents(
     if not client.is_available:
         return _UNAVAILABLE
 
+    # A blank query cannot match anything useful; skip the provider round-trip
+    if not query or not query.strip():
+        return {"results": [], "total": 0, "query": query}
+
     lang_code = _resolve_language(language)
     queries = _build_language_queries([query], lang_code) if lang_code else [query]
 
-    seen_ids: set = set()
-    all_results = []
-    for q in queries:
-        results = await client.search(q, limit=limit)
-        for r in results:
-            if r["id"] not in seen_ids:
-                seen_ids.add(r["id"])
-                all_results.append(r)
-
-    ranked = _rank_with_language(all_results, lang_code)
+    ranked = _rank_with_language(await _search_all(client, queries, limit), lang_code)
 
     resp: Dict[str, Any] = {"results": ranked[:limit], "total": len(ranked), "query": query}
     if lang_code:
@@ -258,6 +299,9 @@ async def search_season(
     if not client.is_available:
         return _UNAVAILABLE
 
+    if not show_title or not show_title.strip():
+        return {"show": show_title, "season": season, "quality": quality, "results": [], "total": 0}
+
     lang_code = _resolve_language(language)
 
     base_queries = [
@@ -266,16 +310,7 @@ async def search_season(
     ]
     queries = _build_language_queries(base_queries, lang_code) if lang_code else base_queries
 
-    seen_ids: set = set()
-    all_results = []
-    for q in queries:
-        results = await client.search(q, limit=limit)
-        for r in results:
-            if r["id"] not in seen_ids:
-                seen_ids.add(r["id"])
-                all_results.append(r)
-
-    ranked = _rank_with_language(all_results, lang_code)
+    ranked = _rank_with_language(await _search_all(client, queries, limit), lang_code)
 
     resp: Dict[str, Any] = {
         "show": show_title,
@@ -1,11 +1,32 @@
 """TorrentSearchClient wrapping torrent-search-mcp for use within videodrome."""
 
 import asyncio
+import inspect
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Identical (query, limit) searches within this window reuse the first result
+SEARCH_CACHE_TTL = 120.0
+_SEARCH_CACHE_MAXSIZE = 256
+
+# Title markers that identify a season pack / collection release
+_PACK_MARKERS = ("complete", "season", " pack", "collection")
+# A single-episode tag (S01E05) means the release is not a pack even if the
+# title also says "season" or "complete"
+_EPISODE_TAG_RE = re.compile(r"s\d{1,2}e\d{1,3}")
+
+
+def _pack_bonus(title_folded: str) -> int:
+    """Return the ranking bonus for a casefolded season-pack title."""
+    if any(m in title_folded for m in _PACK_MARKERS) and not _EPISODE_TAG_RE.search(title_folded):
+        return 1000
+    return 0
+
 
 class TorrentSearchClient:
     """
@@ -20,20 +41,28 @@ class TorrentSearchClient:
         - ygg  (requires YGG_USERNAME / YGG_PASSWORD)
     """
 
-    def __init__(self, providers: List[str] = None):
+    def __init__(self, providers: List[str] = None, cache_ttl: float = SEARCH_CACHE_TTL):
         self.providers = providers or ["thepiratebay"]
         self._provider_aliases = {
             "thepiratebay": {"thepiratebay", "tpb", "thepiratebay.org"},
             "nyaa": {"nyaa", "nyaa.si"},
             "ygg": {"ygg", "yggtorrent", "www.yggtorrent.ms"},
         }
+        self._allowed_sources = self._build_allowed_sources(self.providers)
         self._is_available = False
+        self._api_cls = None
+        self._supports_provider_kw = False
         self._api = None
+        self._cache_ttl = cache_ttl
+        # (normalised query, limit) -> (expires_at monotonic, results)
+        self._search_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._search_locks: Dict[Tuple[str, int], asyncio.Lock] = {}
 
     def connect(self) -> bool:
         """Verify torrent-search-mcp is importable."""
         try:
-            from torrent_search.wrapper import TorrentSearchApi  # noqa: F401
+            from torrent_search.wrapper import TorrentSearchApi
+            self._set_api_cls(TorrentSearchApi)
             self._is_available = True
             logger.info("TorrentSearchClient ready (providers: %s)", self.providers)
             return True
@@ -44,10 +73,26 @@ class TorrentSearchClient:
             )
             return False
 
+    def _set_api_cls(self, api_cls) -> None:
+        """Store the API class and detect once whether it accepts ``providers=``.
+
+        Older torrent-search-mcp releases have no provider argument; results
+        are always filtered client-side, so the kwarg only saves upstream work.
+        """
+        self._api_cls = api_cls
+        try:
+            params = inspect.signature(api_cls.search_torrents).parameters
+        except (AttributeError, TypeError, ValueError):
+            params = {}
+        self._supports_provider_kw = "providers" in params
+
     def _get_api(self):
         if self._api is None:
-            from torrent_search.wrapper import TorrentSearchApi
-            self._api = TorrentSearchApi()
+            if self._api_cls is None:
+                # Not connected yet - resolve the class once and keep it
+                from torrent_search.wrapper import TorrentSearchApi
+                self._set_api_cls(TorrentSearchApi)
+            self._api = self._api_cls()
         return self._api
 
     @property
@@ -58,17 +103,67 @@ class TorrentSearchClient:
         """
         Search for torrents by query string.
 
+        Results are cached for ``cache_ttl`` seconds per (query, limit);
+        concurrent identical searches share a single upstream request.
+
         Returns list of normalised result dicts with keys:
             id, title, source, size, seeders, leechers, date, magnet
         """
-        api = self._get_api()
-        results = await api.search_torrents(query, max_items=limit)
-        normalised = [self._normalise(r) for r in (results or [])]
+        if self._cache_ttl <= 0:
+            return await self._search_uncached(query, limit)
 
-        if self.providers:
-            normalised = [r for r in normalised if self._is_provider_allowed(r.get("source", ""))]
+        key = (" ".join(query.lower().split()), limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
 
-        return normalised[:limit]
+        lock = self._search_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have filled the cache while we waited
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return list(cached)
+                # Errors propagate uncached so the next call retries upstream
+                results = await self._search_uncached(query, limit)
+                self._cache_put(key, results)
+                return list(results)
+        finally:
+            if not lock.locked():
+                self._search_locks.pop(key, None)
+
+    def _cache_get(self, key: Tuple[str, int]) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for key, or None when missing or expired."""
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if time.monotonic() >= expires_at:
+            self._search_cache.pop(key, None)
+            return None
+        return results
+
+    def _cache_put(self, key: Tuple[str, int], results: List[Dict[str, Any]]) -> None:
+        """Store results, evicting the oldest entry once the cache is full."""
+        if key not in self._search_cache and len(self._search_cache) >= _SEARCH_CACHE_MAXSIZE:
+            del self._search_cache[next(iter(self._search_cache))]
+        self._search_cache[key] = (time.monotonic() + self._cache_ttl, results)
+
+    async def _search_uncached(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Query torrent-search-mcp and return filtered, normalised results."""
+        api = self._get_api()
+        if self._supports_provider_kw:
+            results = await api.search_torrents(query, providers=self.providers, max_items=limit)
+        else:
+            results = await api.search_torrents(query, max_items=limit)
+
+        # Normalise, filter and truncate in one lazy pass: no intermediate
+        # lists, and nothing past the limit is normalised
+        normalised = map(self._normalise, results or ())
+        if self._allowed_sources is not None:
+            allowed = self._is_provider_allowed
+            normalised = (r for r in normalised if allowed(r["source"]))
+        return list(islice(normalised, limit))
 
     async def get_magnet(self, torrent_id: str) -> Optional[str]:
         """
@@ -96,29 +191,36 @@ class TorrentSearchClient:
             data = raw
         else:
             data = vars(raw)
+        get = data.get
+        seeders = get("seeders")
+        leechers = get("leechers")
+        # Providers usually return ints already; only cast strings / None
         return {
-            "id": data.get("id", ""),
-            "title": data.get("filename", data.get("title", "")),
-            "source": data.get("source", ""),
-            "size": data.get("size", ""),
-            "seeders": int(data.get("seeders") or 0),
-            "leechers": int(data.get("leechers") or 0),
-            "date": data.get("date", ""),
-            "magnet": data.get("magnet_link", data.get("magnet")),
+            "id": get("id", ""),
+            "title": get("filename") or get("title", ""),
+            "source": get("source", ""),
+            "size": get("size", ""),
+            "seeders": seeders if type(seeders) is int else int(seeders or 0),
+            "leechers": leechers if type(leechers) is int else int(leechers or 0),
+            "date": get("date", ""),
+            "magnet": get("magnet_link") or get("magnet"),
         }
 
-    def _is_provider_allowed(self, source: str) -> bool:
-        """Return True when source matches the configured provider allow-list."""
-        if not self.providers:
-            return True
-
-        source_key = str(source or "").strip().lower()
+    def _build_allowed_sources(self, providers: List[str]) -> Optional[frozenset]:
+        """Expand configured providers to the frozenset of accepted source names."""
+        if not providers:
+            return None
         allowed_aliases = set()
-        for provider in self.providers:
+        for provider in providers:
             provider_key = str(provider or "").strip().lower()
             allowed_aliases.update(self._provider_aliases.get(provider_key, {provider_key}))
+        return frozenset(allowed_aliases)
 
-        return source_key in allowed_aliases
+    def _is_provider_allowed(self, source: str) -> bool:
+        """Return True when source matches the configured provider allow-list."""
+        if self._allowed_sources is None:
+            return True
+        return str(source or "").strip().lower() in self._allowed_sources
 
     @staticmethod
     def rank(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -126,13 +228,9 @@ class TorrentSearchClient:
         Sort results: season packs first, then by seeder count descending.
 
         Season packs are identified by keywords in the title:
-            complete, season, s0, pack
+            complete, season, pack, collection (unless tagged SxxEyy)
         """
         def _score(r: Dict[str, Any]) -> int:
-            pack_bonus = 1000 if any(
-                kw in r["title"].lower()
-                for kw in ("complete", "season", " pack", "collection")
-            ) else 0
-            return pack_bonus + r["seeders"]
+            return _pack_bonus(r["title"].casefold()) + r["seeders"]
 
         return sorted(results, key=_score, reverse=True)
@@ -1,8 +1,8 @@
 """Transmission BitTorrent client wrapper for automated downloads."""
 
 import logging
-from typing import Optional, List, Dict, Any
-from pathlib import Path
+import re
+from typing import Optional, List, Dict, Any, Protocol
 from urllib.parse import urlparse
 
 import transmission_rpc
@@ -12,17 +12,38 @@ from transmission_rpc.error import TransmissionError
 logger = logging.getLogger(__name__)
 
 
+# A magnet URI, or a path/URL whose path (before any query/fragment) ends in .torrent
+_TORRENT_REF_RE = re.compile(r"^magnet:|^[^?#]*\.torrent(?:[?#]|$)", re.IGNORECASE)
+
+
 def is_valid_torrent_reference(torrent: str) -> bool:
     """Validate accepted torrent references (magnet URI or .torrent path/URL)."""
-    if not torrent:
-        return False
+    return bool(torrent) and _TORRENT_REF_RE.search(torrent) is not None
 
-    if torrent.startswith("magnet:"):
-        return True
 
-    parsed = urlparse(torrent)
-    torrent_path = parsed.path or torrent
-    return Path(torrent_path).suffix.lower() == ".torrent"
+class TorrentClient(Protocol):
+    """Protocol for the torrent client operations the ingest watcher relies on.
+
+    TransmissionClient satisfies it; tests can pass any object with the same
+    shape.
+    """
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the client currently has a live connection."""
+        ...
+
+    def connect(self) -> bool:
+        """Connect to the torrent daemon, returning True on success."""
+        ...
+
+    def get_completed_torrents(self) -> List[Dict[str, Any]]:
+        """Return finished torrents with id, hash, name and files keys."""
+        ...
+
+    def remove_torrent(self, torrent_id: int, delete_data: bool = False) -> Dict[str, Any]:
+        """Remove a torrent, optionally deleting its data."""
+        ...
 
 
 class TransmissionClient:
@@ -387,11 +408,6 @@ class TransmissionClient:
         Returns:
             List of absolute file paths
         """
-        files = []
-        download_dir = Path(torrent.download_dir)
-
-        for file_info in torrent.get_files():
-            file_path = download_dir / file_info.name
-            files.append(str(file_path))
-
-        return files
+        # Plain string joins: no Path object per file for large multi-file torrents
+        download_dir = torrent.download_dir.rstrip("/")
+        return [f"{download_dir}/{file_info.name}" for file_info in torrent.get_files()]
@@ -2,71 +2,236 @@
 
 import asyncio
 import os
+import sys
 import time
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple, Union
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent
+from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileMovedEvent
 import logging
 
 from server.matcher import MediaMatcher
 from server.files import FileManager
 from server.history import IngestHistory, IngestStatus
+from server.transmission import TorrentClient
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on remembered torrent hashes. Far larger than any realistic
+# Transmission session, so eviction only trims hashes of long-gone torrents.
+MAX_PROCESSED_TORRENT_HASHES = 10_000
+
+# Files stat'ed concurrently per batch by the stability loop
+STAT_BATCH_SIZE = 64
+
+# Files under stability watch are keyed by (st_dev, st_ino) so a rename keeps
+# its checker; st_ino isn't dependable on Windows, which keys by path instead
+_INODE_KEYS = sys.platform != "win32"
+
+
+class WatcherState(IntEnum):
+    """IngestWatcher lifecycle state."""
+    STOPPED = 0
+    STARTING = 1
+    RUNNING = 2
+    STOPPING = 3
+
 
 class FileStabilityChecker:
-    """Checks if a file has reached a stable size (no longer being written)."""
+    """Checks if a file has stopped changing (no longer being written).
 
-    def __init__(self, path: Path, stability_seconds: int = 60):
+    Stability is judged on a (size, mtime_ns) fingerprint so that files
+    preallocated to their final size by a torrent client are still treated as
+    in-progress while their contents are being written.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        stability_seconds: int = 60,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize stability checker.
 
         Args:
             path: Path to file to monitor
-            stability_seconds: Seconds file size must remain constant
+            stability_seconds: Seconds the file must remain unchanged
+            clock: Monotonic time source (injectable for tests)
         """
         self.path = path
+        self._path_str = os.fspath(path)
         self.stability_seconds = stability_seconds
+        self._clock = clock
         self.stable_size: Optional[int] = None
         self.stable_since: Optional[float] = None
+        self._last_fingerprint: Optional[Tuple[int, int]] = None
         self.is_stable = False
 
+    def moved_to(self, path: Path):
+        """
+        Follow the file to a new name without restarting the stability window.
+
+        Args:
+            path: New path of the file
+        """
+        self.path = path
+        self._path_str = os.fspath(path)
+
     async def check(self) -> bool:
         """
         Check if file is stable.
 
+        Each call takes one stat; the watcher's polling interval provides the
+        spacing between fingerprints.
+
         Returns:
-            True if file has been stable for required duration
+            True if file has been unchanged for required duration
         """
-        if not self.path.exists():
+        # One os.stat on a cached path string instead of Path.exists() + Path.stat()
+        try:
+            st = os.stat(self._path_str)
+        except OSError:
             return False
+        return self.observe(st)
 
-        current_size = self.path.stat().st_size
+    def observe(self, st: os.stat_result) -> bool:
+        """
+        Record a stat result taken by the caller and report stability.
 
-        if self.stable_size is None:
-            # First check - record size
-            self.stable_size = current_size
-            self.stable_since = time.time()
-            return False
+        Lets the watcher stat many files in one concurrent batch.
 
-        if current_size != self.stable_size:
-            # Size changed - reset
-            self.stable_size = current_size
-            self.stable_since = time.time()
+        Returns:
+            True if file has been unchanged for required duration
+        """
+        fingerprint = (st.st_size, st.st_mtime_ns)
+        if fingerprint != self._last_fingerprint:
+            # First check, or size/mtime changed - (re)start the stability window
+            self._last_fingerprint = fingerprint
+            self.stable_size = st.st_size
+            self.stable_since = self._clock()
             return False
 
         # Check if stable long enough
-        elapsed = time.time() - self.stable_since
-        if elapsed >= self.stability_seconds:
+        if self._clock() - self.stable_since >= self.stability_seconds:
             self.is_stable = True
             return True
 
         return False
 
 
+@dataclass(slots=True, frozen=True)
+class PendingItem:
+    """A file queued for manual review."""
+    source: str
+    match: Dict[str, Any]
+    confidence: float
+    parsed: Optional[Dict[str, Any]] = None
+    plex_path: Optional[str] = None
+    torrent_hash: Optional[str] = None
+    torrent_name: Optional[str] = None
+
+
+class PendingQueue:
+    """Files awaiting manual review, stored column-wise.
+
+    Each PendingItem field lives in its own column (confidences in a packed
+    ``array('d')``) with a source -> row index for O(1) lookup; items are only
+    turned back into dicts at the API boundary. Items are listed in arrival
+    order; removal shifts the later rows down.
+    """
+
+    __slots__ = ("sources", "confidences", "matches", "parsed", "plex_paths", "torrents", "_index")
+
+    def __init__(self):
+        self.sources: List[str] = []
+        self.confidences = array("d")
+        self.matches: List[Dict[str, Any]] = []
+        self.parsed: List[Optional[Dict[str, Any]]] = []
+        self.plex_paths: List[Optional[str]] = []
+        # (torrent_hash, torrent_name) for items that came from Transmission
+        self.torrents: List[Optional[Tuple[str, Optional[str]]]] = []
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def __contains__(self, source: object) -> bool:
+        return source in self._index
+
+    def __setitem__(self, source: str, item: Union[PendingItem, Mapping[str, Any]]):
+        if not isinstance(item, PendingItem):
+            item = PendingItem(**item)
+        torrent = (item.torrent_hash, item.torrent_name) if item.torrent_hash is not None else None
+        row = self._index.get(source)
+        if row is not None:
+            self.matches[row] = item.match
+            self.confidences[row] = item.confidence
+            self.parsed[row] = item.parsed
+            self.plex_paths[row] = item.plex_path
+            self.torrents[row] = torrent
+            return
+        source = sys.intern(source)
+        self._index[source] = len(self.sources)
+        self.sources.append(source)
+        self.matches.append(item.match)
+        self.confidences.append(item.confidence)
+        self.parsed.append(item.parsed)
+        self.plex_paths.append(item.plex_path)
+        self.torrents.append(torrent)
+
+    def __getitem__(self, source: str) -> Dict[str, Any]:
+        return self._row(self._index[source])
+
+    def __delitem__(self, source: str):
+        row = self._index.pop(source)
+        self.sources.pop(row)
+        self.confidences.pop(row)
+        self.matches.pop(row)
+        self.parsed.pop(row)
+        self.plex_paths.pop(row)
+        self.torrents.pop(row)
+        # Later rows shift down one; keep arrival order for the review list
+        for i in range(row, len(self.sources)):
+            self._index[self.sources[i]] = i
+
+    def _row(self, row: int) -> Dict[str, Any]:
+        item = {
+            "source": self.sources[row],
+            "match": self.matches[row],
+            "confidence": self.confidences[row],
+        }
+        parsed = self.parsed[row]
+        if parsed is not None:
+            item["parsed"] = parsed
+        plex_path = self.plex_paths[row]
+        if plex_path is not None:
+            item["plex_path"] = plex_path
+        torrent = self.torrents[row]
+        if torrent is not None:
+            item["torrent_hash"], item["torrent_name"] = torrent
+        return item
+
+    def rows(self, min_confidence: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Materialise items as dicts.
+
+        With min_confidence, the packed confidence column is scanned first and
+        dicts are only built for rows at or above the threshold.
+        """
+        if min_confidence is None:
+            return [self._row(row) for row in range(len(self.sources))]
+        return [
+            self._row(row)
+            for row, confidence in enumerate(self.confidences)
+            if confidence >= min_confidence
+        ]
+
+
 class IngestEventHandler(FileSystemEventHandler):
     """Handles file system events for the ingest watcher."""
 
@@ -79,15 +244,19 @@ class IngestEventHandler(FileSystemEventHandler):
         """Handle file creation events."""
         if event.is_directory:
             return
+        self._dispatch(event.src_path)
 
-        file_path = Path(event.src_path)
+    def on_moved(self, event: FileMovedEvent):
+        """Handle files renamed into place (e.g. a finished ``.part`` download)."""
+        if event.is_directory:
+            return
+        self._dispatch(event.dest_path)
 
-        # Schedule async handling via event loop
-        if self.watcher._loop:
-            self.watcher._loop.call_soon_threadsafe(
-                asyncio.create_task,
-                self.watcher._handle_new_file(file_path)
-            )
+    def _dispatch(self, path: str):
+        """Hand a path from the observer thread to the watcher's event loop."""
+        loop = self.watcher._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self.watcher._schedule_new_file, Path(path))
 
 
 class IngestWatcher:
@@ -102,7 +271,7 @@ class IngestWatcher:
         auto_ingest: bool = False,
         confidence_threshold: float = 0.85,
         stability_seconds: int = 60,
-        transmission_client: Optional[Any] = None
+        transmission_client: Optional[TorrentClient] = None
     ):
         """
         Initialize ingest watcher.
@@ -130,77 +299,98 @@ class IngestWatcher:
         self.transmission_poll_interval = int(os.getenv("TRANSMISSION_POLL_INTERVAL", "30"))
         self.transmission_auto_remove = os.getenv("TRANSMISSION_AUTO_REMOVE", "false").lower() == "true"
 
-        self.is_running = False
+        # Lifecycle; start()/stop() transition under _state_lock
+        self._state = WatcherState.STOPPED
+        self._state_lock = asyncio.Lock()
         self.observer: Optional[Observer] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Processing state
-        self._processing: Dict[Path, FileStabilityChecker] = {}
-        self._pending_queue: Dict[str, Dict[str, Any]] = {}
+        # (st_dev, st_ino) -> checker, or path -> checker when the file couldn't
+        # be stat'ed or inodes aren't used (see _INODE_KEYS)
+        self._processing: Dict[Any, FileStabilityChecker] = {}
+        self._pending_queue = PendingQueue()
         self._stability_task: Optional[asyncio.Task] = None
         self._transmission_task: Optional[asyncio.Task] = None
 
-        # Track processed torrent hashes to prevent duplicates
-        self._processed_torrent_hashes: Set[str] = set()
+        # Track processed torrent hashes to prevent duplicates. An insertion-
+        # ordered dict used as a bounded set: the oldest hashes are dropped
+        # once MAX_PROCESSED_TORRENT_HASHES is reached.
+        self._processed_torrent_hashes: Dict[str, None] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher is fully started."""
+        return self._state == WatcherState.RUNNING
 
     async def start(self):
         """Start watching the ingest directory."""
-        if self.is_running:
-            logger.warning("Watcher already running")
-            return
-
-        # Get event loop for bridging
-        self._loop = asyncio.get_event_loop()
-
-        # Start watchdog observer
-        event_handler = IngestEventHandler(self)
-        self.observer = Observer()
-        self.observer.schedule(event_handler, str(self.ingest_dir), recursive=False)
-        self.observer.start()
-
-        # Start stability check background task
-        self._stability_task = asyncio.create_task(self._stability_check_loop())
-
-        # Start Transmission polling task if client is configured (retries internally if not yet connected)
-        if self.transmission_client:
-            self._transmission_task = asyncio.create_task(self._transmission_poll_loop())
-            logger.info(f"Transmission polling enabled (interval: {self.transmission_poll_interval}s)")
+        async with self._state_lock:
+            if self._state != WatcherState.STOPPED:
+                logger.warning("Watcher already running")
+                return
+            self._state = WatcherState.STARTING
 
-        self.is_running = True
-        logger.info(f"Watcher started on {self.ingest_dir}")
+            try:
+                # Get event loop for bridging
+                self._loop = asyncio.get_running_loop()
+
+                # Start watchdog observer
+                event_handler = IngestEventHandler(self)
+                self.observer = Observer()
+                self.observer.schedule(event_handler, str(self.ingest_dir), recursive=False)
+                self.observer.start()
+            except BaseException:
+                self.observer = None
+                self._loop = None
+                self._state = WatcherState.STOPPED
+                raise
+
+            # Start stability check background task
+            self._stability_task = asyncio.create_task(self._stability_check_loop())
+
+            # Start Transmission polling task if client is configured (retries internally if not yet connected)
+            if self.transmission_client:
+                self._transmission_task = asyncio.create_task(self._transmission_poll_loop())
+                logger.info(f"Transmission polling enabled (interval: {self.transmission_poll_interval}s)")
+
+            self._state = WatcherState.RUNNING
+            logger.info(f"Watcher started on {self.ingest_dir}")
 
     async def stop(self):
         """Stop watching the ingest directory."""
-        if not self.is_running:
-            return
-
-        # Stop observer
-        if self.observer:
-            self.observer.stop()
-            self.observer.join()
-            self.observer = None
+        async with self._state_lock:
+            if self._state != WatcherState.RUNNING:
+                return
+            self._state = WatcherState.STOPPING
 
-        # Cancel stability task
-        if self._stability_task:
-            self._stability_task.cancel()
-            try:
-                await self._stability_task
-            except asyncio.CancelledError:
-                pass
-            self._stability_task = None
+            # Stop observer; join off-loop so a slow observer thread can't stall other tasks
+            if self.observer:
+                self.observer.stop()
+                await asyncio.to_thread(self.observer.join, 5)
+                self.observer = None
 
-        # Cancel Transmission polling task
-        if self._transmission_task:
-            self._transmission_task.cancel()
-            try:
-                await self._transmission_task
-            except asyncio.CancelledError:
-                pass
-            self._transmission_task = None
+            # Cancel stability task
+            if self._stability_task:
+                self._stability_task.cancel()
+                try:
+                    await self._stability_task
+                except asyncio.CancelledError:
+                    pass
+                self._stability_task = None
+
+            # Cancel Transmission polling task
+            if self._transmission_task:
+                self._transmission_task.cancel()
+                try:
+                    await self._transmission_task
+                except asyncio.CancelledError:
+                    pass
+                self._transmission_task = None
 
-        self.is_running = False
-        self._loop = None
-        logger.info("Watcher stopped")
+            self._state = WatcherState.STOPPED
+            self._loop = None
+            logger.info("Watcher stopped")
 
     async def get_status(self) -> Dict[str, Any]:
         """
@@ -210,7 +400,8 @@ class IngestWatcher:
             Dictionary with watcher state information
         """
         return {
-            "is_running": self.is_running,
+            "is_running": self._state == WatcherState.RUNNING,
+            "state": self._state.name.lower(),
             "ingest_dir": str(self.ingest_dir),
             "auto_ingest": self.auto_ingest,
             "confidence_threshold": self.confidence_threshold,
@@ -252,14 +443,17 @@ class IngestWatcher:
             "stability_seconds": self.stability_seconds
         }
 
-    async def get_pending_queue(self) -> List[Dict[str, Any]]:
+    async def get_pending_queue(self, min_confidence: Optional[float] = None) -> List[Dict[str, Any]]:
         """
-        Get all pending queue items.
+        Get pending queue items.
+
+        Args:
+            min_confidence: Only return items with at least this confidence
 
         Returns:
             List of pending items awaiting review
         """
-        return list(self._pending_queue.values())
+        return self._pending_queue.rows(min_confidence)
 
     async def approve_pending(self, source: str) -> Dict[str, Any]:
         """
@@ -271,6 +465,9 @@ class IngestWatcher:
         Returns:
             Processing result
         """
+        # Queue keys are interned; interning the argument once lets the
+        # lookups below match by identity
+        source = sys.intern(source)
         if source not in self._pending_queue:
             return {
                 "status": "error",
@@ -324,6 +521,9 @@ class IngestWatcher:
         Returns:
             Result status
         """
+        # Queue keys are interned; interning the argument once lets the
+        # lookups below match by identity
+        source = sys.intern(source)
         if source not in self._pending_queue:
             return {
                 "status": "error",
@@ -337,6 +537,10 @@ class IngestWatcher:
             "message": f"Rejected {source}"
         }
 
+    def _schedule_new_file(self, file_path: Path):
+        """Run _handle_new_file on the loop (called via call_soon_threadsafe)."""
+        asyncio.create_task(self._handle_new_file(file_path))
+
     async def _handle_new_file(self, file_path: Path):
         """
         Handle a newly detected file.
@@ -349,11 +553,31 @@ class IngestWatcher:
             logger.debug(f"Ignoring file with invalid extension: {file_path}")
             return
 
+        key: Any = file_path
+        if _INODE_KEYS:
+            try:
+                st = await asyncio.to_thread(os.stat, file_path)
+            except OSError:
+                pass
+            else:
+                key = (st.st_dev, st.st_ino)
+                # An earlier event may have tracked this path before it could
+                # be stat'ed; move that entry under the inode so it isn't
+                # processed twice
+                pending = self._processing.pop(file_path, None)
+                if pending is not None:
+                    self._processing.setdefault(key, pending)
+
         # Add to processing with stability checker
-        if file_path not in self._processing:
+        checker = self._processing.get(key)
+        if checker is None:
             checker = FileStabilityChecker(file_path, self.stability_seconds)
-            self._processing[file_path] = checker
+            self._processing[key] = checker
             logger.info(f"New file detected: {file_path}")
+        elif checker.path != file_path:
+            # Renamed mid-check (e.g. by the torrent client); keep its window
+            logger.info(f"Tracked file renamed: {checker.path} -> {file_path}")
+            checker.moved_to(file_path)
 
     async def _stability_check_loop(self):
         """Background task that checks file stability."""
@@ -361,22 +585,64 @@ class IngestWatcher:
             try:
                 await asyncio.sleep(10)  # Check every 10 seconds
 
-                # Check all processing files
-                stable_files = []
-                for file_path, checker in list(self._processing.items()):
-                    if await checker.check():
-                        stable_files.append(file_path)
-
-                # Process stable files
-                for file_path in stable_files:
-                    await self._process_stable_file(file_path)
-                    del self._processing[file_path]
+                await self._process_stable_files()
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in stability check loop: {e}")
 
+    async def _process_stable_files(self):
+        """Process every file that has become stable and stop tracking it."""
+        for checker in await self._find_stable_files():
+            await self._process_stable_file(checker.path)
+            # _handle_new_file may have re-keyed the entry (path -> inode)
+            # while the file was processed, so drop it by identity
+            for key in [k for k, c in self._processing.items() if c is checker]:
+                del self._processing[key]
+
+    async def _find_stable_files(self) -> List[FileStabilityChecker]:
+        """
+        Stat every file under stability watch and return those now stable.
+
+        Stats are issued concurrently off the event loop in batches of
+        STAT_BATCH_SIZE, keeping a pool of requests in flight on slow (NAS)
+        storage instead of one blocking stat per file.
+
+        Returns:
+            Checkers of the stable files
+        """
+        items = list(self._processing.items())
+        stable_files = []
+        for start in range(0, len(items), STAT_BATCH_SIZE):
+            batch = items[start:start + STAT_BATCH_SIZE]
+            stats = await asyncio.gather(
+                *(asyncio.to_thread(os.stat, checker._path_str) for _, checker in batch),
+                return_exceptions=True,
+            )
+            for (_, checker), st in zip(batch, stats):
+                # Missing/unreadable files stay in processing until they settle
+                if not isinstance(st, BaseException) and checker.observe(st):
+                    stable_files.append(checker)
+        return stable_files
+
+    async def _paths_exist(self, paths: List[str]) -> List[bool]:
+        """
+        Check which paths exist, in concurrent batches of STAT_BATCH_SIZE.
+
+        Args:
+            paths: File paths to check
+
+        Returns:
+            One flag per path, in input order
+        """
+        flags: List[bool] = []
+        for start in range(0, len(paths), STAT_BATCH_SIZE):
+            flags += await asyncio.gather(
+                *(asyncio.to_thread(os.path.exists, p) for p in paths[start:start + STAT_BATCH_SIZE])
+            )
+        return flags
+
     async def _process_stable_file(self, file_path: Path):
         """
         Process a file that has reached stable size.
@@ -410,12 +676,14 @@ class IngestWatcher:
                 await self._ingest_file(file_path, match_result)
             else:
                 logger.info(f"Queueing {file_path} for review (confidence: {confidence:.2f})")
-                self._pending_queue[str(file_path)] = {
-                    "source": str(file_path),
-                    "match": match,
-                    "confidence": confidence,
-                    "parsed": parsed
-                }
+                source = str(file_path)
+                self._pending_queue[source] = PendingItem(
+                    source=source,
+                    match=match,
+                    confidence=confidence,
+                    parsed=parsed,
+                    plex_path=match_result["plex_path"]
+                )
 
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
@@ -528,7 +796,7 @@ class IngestWatcher:
                     # Mark as processed only when all video files reached a terminal state.
                     # Missing files or processing errors should be retried on the next poll.
                     if result["mark_processed"]:
-                        self._processed_torrent_hashes.add(torrent_hash)
+                        self._mark_torrent_processed(torrent_hash)
                     else:
                         logger.info(
                             f"Deferring completion mark for torrent {torrent['name']} "
@@ -542,6 +810,13 @@ class IngestWatcher:
 
         logger.info("Transmission polling loop stopped")
 
+    def _mark_torrent_processed(self, torrent_hash: str):
+        """Remember a processed torrent hash, evicting the oldest past the cap."""
+        processed = self._processed_torrent_hashes
+        processed[torrent_hash] = None
+        if len(processed) > MAX_PROCESSED_TORRENT_HASHES:
+            del processed[next(iter(processed))]
+
     async def _process_torrent_files(self, torrent: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process all video files from a completed torrent.
@@ -570,7 +845,6 @@ class IngestWatcher:
                 "mark_processed": True
             }
 
-        video_file_count = 0
         success_count = 0
         queued_count = 0
         duplicate_count = 0
@@ -578,18 +852,22 @@ class IngestWatcher:
         missing_count = 0
         error_count = 0
 
+        # Check if valid video file
+        video_files = []
         for file_path_str in files:
-            file_path = Path(file_path_str)
+            if self.file_manager.is_valid_extension(file_path_str):
+                video_files.append(file_path_str)
+            else:
+                logger.debug(f"Skipping non-video file: {file_path_str}")
+        video_file_count = len(video_files)
 
-            # Check if valid video file
-            if not self.file_manager.is_valid_extension(file_path):
-                logger.debug(f"Skipping non-video file: {file_path}")
-                continue
+        # Check existence of every video file up front, concurrently
+        exists_flags = await self._paths_exist(video_files)
 
-            video_file_count += 1
+        for file_path_str, exists in zip(video_files, exists_flags):
+            file_path = Path(file_path_str)
 
-            # Check if file exists
-            if not file_path.exists():
+            if not exists:
                 logger.warning(f"File does not exist: {file_path}")
                 missing_count += 1
                 continue
@@ -629,14 +907,16 @@ class IngestWatcher:
 
                 else:
                     logger.info(f"Queueing {file_path} for review (confidence: {confidence:.2f})")
-                    self._pending_queue[str(file_path)] = {
-                        "source": str(file_path),
-                        "match": match,
-                        "confidence": confidence,
-                        "parsed": parsed,
-                        "torrent_hash": torrent_hash,
-                        "torrent_name": torrent_name
-                    }
+                    source = str(file_path)
+                    self._pending_queue[source] = PendingItem(
+                        source=source,
+                        match=match,
+                        confidence=confidence,
+                        parsed=parsed,
+                        plex_path=match_result["plex_path"],
+                        torrent_hash=torrent_hash,
+                        torrent_name=torrent_name
+                    )
                     queued_count += 1
 
             except Exception as e:
@@ -1,9 +1,6 @@
 """Shared pytest fixtures for Plex Claude Plugin tests."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 from typing import Dict, Any
 
@@ -172,11 +169,13 @@ def mock_guessit_tv() -> Dict[str, Any]:
 # =============================================================================
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory that is cleaned up after the test."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+def temp_dir(tmp_path):
+    """Create a temporary directory for the test.
+
+    Backed by pytest's tmp_path, which prunes old runs in bulk instead of
+    paying an rmtree in every test's teardown.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -259,30 +258,46 @@ def mock_env(monkeypatch, temp_media_root, temp_ingest_dir):
 # Mock Async Client Fixtures
 # =============================================================================
 
+_DEFAULT_LIBRARIES = [
+    {
+        "key": "1",
+        "title": "Movies",
+        "type": "movie",
+        "locations": ["/data/media/Movies"]
+    },
+    {
+        "key": "2",
+        "title": "TV Shows",
+        "type": "show",
+        "locations": ["/data/media/TV Shows"]
+    }
+]
+
+_DEFAULT_SERVER_INFO = {
+    "name": "Test Plex Server",
+    "version": "1.40.0.0000-deadbeef",
+    "platform": "Linux"
+}
+
+
+@pytest.fixture(scope="session")
+def _shared_async_plex_client():
+    """Build the AsyncMock once; child mocks are created lazily and then reused."""
+    return AsyncMock()
+
+
 @pytest.fixture
-def mock_async_plex_client(mock_plex_server):
-    """Create a mock async PlexClient for testing."""
-    client = AsyncMock()
+def mock_async_plex_client(_shared_async_plex_client, mock_plex_server):
+    """Create a mock async PlexClient for testing.
+
+    The session-wide mock is reset rather than rebuilt, so tests configure
+    methods via ``.return_value`` / ``.side_effect`` instead of reassigning them.
+    """
+    client = _shared_async_plex_client
+    client.reset_mock(return_value=True, side_effect=True)
     client.server = mock_plex_server
-    client.list_libraries = AsyncMock(return_value=[
-        {
-            "key": "1",
-            "title": "Movies",
-            "type": "movie",
-            "locations": ["/data/media/Movies"]
-        },
-        {
-            "key": "2",
-            "title": "TV Shows",
-            "type": "show",
-            "locations": ["/data/media/TV Shows"]
-        }
-    ])
-    client.get_server_info = AsyncMock(return_value={
-        "name": "Test Plex Server",
-        "version": "1.40.0.0000-deadbeef",
-        "platform": "Linux"
-    })
+    client.list_libraries.return_value = [dict(lib) for lib in _DEFAULT_LIBRARIES]
+    client.get_server_info.return_value = dict(_DEFAULT_SERVER_INFO)
     return client
 
 
@@ -221,3 +221,31 @@ async def test_list_recent_section_not_found(mock_plex_server):
 
     with pytest.raises(NotFound):
         await client.list_recent("999", 10)
+
+
+@pytest.mark.asyncio
+async def test_get_library_inventory_batches_season_fetch(mock_plex_server):
+    """get_library_inventory should fetch all seasons once instead of per show."""
+    client = PlexAPIClient(mock_plex_server)
+
+    show = MagicMock(title="Breaking Bad", year=2008, ratingKey=101)
+
+    def _season(number, episodes):
+        return MagicMock(parentRatingKey=101, seasonNumber=number, leafCount=episodes)
+
+    section = MagicMock()
+    section.all.return_value = [show]
+    section.searchSeasons.return_value = [_season(0, 3), _season(2, 13), _season(1, 7)]
+    mock_plex_server.library.sectionByID.return_value = section
+
+    result = await client.get_library_inventory("2")
+
+    assert result == [{
+        "title": "Breaking Bad",
+        "year": 2008,
+        "rating_key": "101",
+        "seasons": [1, 2],
+        "episode_count": 20,
+    }]
+    section.searchSeasons.assert_called_once_with()
+    show.seasons.assert_not_called()
@@ -60,6 +60,19 @@ class TestExtensionValidation:
         assert fm.is_valid_extension(Path("test.Mp4")) is True
         assert fm.is_valid_extension(Path("test.AVI")) is True
 
+    def test_extension_checked_on_basename_only(self, temp_media_root, temp_ingest_dir):
+        """Dots in parent directories shouldn't affect the check."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        assert fm.is_valid_extension("/downloads/Show.S01.mkv/readme.txt") is False
+        assert fm.is_valid_extension("/downloads/Show.S01/Show.S01E01.MKV") is True
+        assert fm.is_valid_extension(Path("Show.S01E01.mkv.part")) is False
+
+    def test_dotfile_named_like_extension_rejected(self, temp_media_root, temp_ingest_dir):
+        """A hidden file whose whole name is an extension isn't a video."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        assert fm.is_valid_extension(".mkv") is False
+        assert fm.is_valid_extension("/ingest/.MP4") is False
+
 
 class TestPathRestrictions:
     """Test path restriction enforcement."""
@@ -131,6 +131,139 @@ class TestAddRecord:
 
         await history.close()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_share_commits(self, temp_dir, temp_ingest_dir, temp_media_root):
+        """Records added while a write is in flight should commit together."""
+        db_path = temp_dir / "ingest_history.db"
+        history = IngestHistory(db_path)
+        await history.initialize()
+
+        commit = history._db.commit
+        commits = 0
+
+        async def counting_commit():
+            nonlocal commits
+            commits += 1
+            await commit()
+
+        history._db.commit = counting_commit
+
+        record_ids = await asyncio.gather(*(
+            history.add_record(
+                source_path=temp_ingest_dir / f"movie{i}.mkv",
+                destination_path=temp_media_root / "Movies" / f"Movie{i}.mkv",
+                status=IngestStatus.SUCCESS
+            )
+            for i in range(5)
+        ))
+
+        # The first record commits alone; the four queued behind it share one
+        assert commits == 2
+        assert len(set(record_ids)) == 5
+        for i, record_id in enumerate(record_ids):
+            record = await history.get_record(record_id)
+            assert record.source_path == str(temp_ingest_dir / f"movie{i}.mkv")
+
+        await history.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_commit_writes_record_once(self, temp_dir, temp_ingest_dir, temp_media_root):
+        """Cancelling a caller mid-commit should neither requeue nor duplicate its record."""
+        db_path = temp_dir / "ingest_history.db"
+        history = IngestHistory(db_path)
+        await history.initialize()
+
+        commit = history._db.commit
+        committing = asyncio.Event()
+        release = asyncio.Event()
+
+        async def issued_commit():
+            # aiosqlite queues the COMMIT on its thread before the await
+            # yields, so it lands even if the awaiting task is cancelled
+            issued = asyncio.ensure_future(commit())
+            committing.set()
+            await release.wait()
+            await issued
+
+        history._db.commit = issued_commit
+
+        task = asyncio.create_task(history.add_record(
+            source_path=temp_ingest_dir / "movie0.mkv",
+            destination_path=temp_media_root / "Movies" / "Movie0.mkv",
+            status=IngestStatus.SUCCESS
+        ))
+        await committing.wait()
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        history._db.commit = commit
+        await history.add_record(
+            source_path=temp_ingest_dir / "movie1.mkv",
+            destination_path=temp_media_root / "Movies" / "Movie1.mkv",
+            status=IngestStatus.SUCCESS
+        )
+
+        records = await history.get_all_records()
+        assert sorted(r.source_path for r in records) == [
+            str(temp_ingest_dir / "movie0.mkv"),
+            str(temp_ingest_dir / "movie1.mkv"),
+        ]
+
+        await history.close()
+
+    @pytest.mark.asyncio
+    async def test_callers_cancelled_while_queued_are_dropped(
+        self, temp_dir, temp_ingest_dir, temp_media_root, monkeypatch
+    ):
+        """Records of callers cancelled before their batch is issued should not be written."""
+        monkeypatch.setattr("server.history.WRITE_BATCH_SIZE", 1)
+        db_path = temp_dir / "ingest_history.db"
+        history = IngestHistory(db_path)
+        await history.initialize()
+
+        commit = history._db.commit
+        committing = asyncio.Event()
+        release = asyncio.Event()
+
+        async def blocked_commit():
+            committing.set()
+            await release.wait()
+            await commit()
+
+        history._db.commit = blocked_commit
+
+        def add(i):
+            return asyncio.create_task(history.add_record(
+                source_path=temp_ingest_dir / f"movie{i}.mkv",
+                destination_path=temp_media_root / "Movies" / f"Movie{i}.mkv",
+                status=IngestStatus.SUCCESS
+            ))
+
+        first = add(0)
+        await committing.wait()
+        cancelled = [add(1), add(2)]
+        live = add(3)
+        await asyncio.sleep(0)  # let the waiters queue their rows
+        for task in cancelled:
+            task.cancel()
+        release.set()
+
+        assert isinstance(await first, int)
+        assert isinstance(await live, int)
+        for task in cancelled:
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        records = await history.get_all_records()
+        assert sorted(r.source_path for r in records) == [
+            str(temp_ingest_dir / "movie0.mkv"),
+            str(temp_ingest_dir / "movie3.mkv"),
+        ]
+
+        await history.close()
+
 
 class TestGetRecord:
     """Test retrieving individual records."""
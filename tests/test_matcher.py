@@ -1,5 +1,7 @@
 """Tests for MediaMatcher with guessit + TMDb pipeline."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from server.matcher import MediaMatcher
@@ -21,6 +23,7 @@ class TestMediaMatcher:
             assert result["title"] == "Inception"
             assert result["year"] == 2010
             assert result["type"] == "movie"
+            assert "_norm_title" not in result
 
     async def test_parse_tv_filename(self, mock_guessit_tv):
         """Test parsing a TV episode filename with guessit."""
@@ -36,6 +39,47 @@ class TestMediaMatcher:
             assert result["episode"] == 1
             assert result["type"] == "episode"
 
+    async def test_parse_filename_reuses_cached_result(self, mock_guessit_movie):
+        """Repeated names should be parsed once and returned as independent copies."""
+        matcher = MediaMatcher(tmdb_api_key="test-key")
+
+        with patch("guessit.guessit") as mock_guessit:
+            mock_guessit.return_value = mock_guessit_movie
+
+            first = await matcher.parse_filename("Inception.2010.1080p.BluRay.x264.mkv")
+            first["title"] = "Changed"
+            second = await matcher.parse_filename("Inception.2010.1080p.BluRay.x264.mkv")
+
+        assert mock_guessit.call_count == 1
+        assert second["title"] == "Inception"
+
+    async def test_parse_filename_with_ptn_parser(self):
+        """Test that the PTN backend is mapped to guessit's result shape."""
+        matcher = MediaMatcher(tmdb_api_key="test-key", parser="ptn")
+
+        mock_ptn = MagicMock()
+        mock_ptn.parse.return_value = {
+            "title": "Breaking Bad",
+            "season": 1,
+            "episode": 1,
+            "resolution": "1080p",
+            "codec": "x264",
+        }
+
+        with patch.dict("sys.modules", {"PTN": mock_ptn}):
+            result = await matcher.parse_filename("Breaking.Bad.S01E01.1080p.BluRay.x264.mkv")
+
+        assert result["title"] == "Breaking Bad"
+        assert result["season"] == 1
+        assert result["screen_size"] == "1080p"
+        assert result["video_codec"] == "x264"
+        assert result["type"] == "episode"
+
+    async def test_unknown_parser_rejected(self):
+        """Test that an unsupported parser backend raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown filename parser"):
+            MediaMatcher(tmdb_api_key="test-key", parser="regex")
+
     async def test_search_tmdb_movie(self, mock_tmdb_movie_result):
         """Test searching TMDb for a movie."""
         cache = AsyncMock()
@@ -76,6 +120,19 @@ class TestMediaMatcher:
             assert results[0]["id"] == 1396
             assert results[0]["name"] == "Breaking Bad"
 
+    async def test_search_tmdb_results_have_no_private_keys(self, mock_tmdb_tv_result):
+        """Test that TMDb results returned and cached carry no internal scoring keys."""
+        matcher = MediaMatcher(tmdb_api_key="test-key")
+
+        with patch("tmdbsimple.Search") as mock_search_class:
+            mock_search = MagicMock()
+            mock_search.tv.return_value = {"results": [mock_tmdb_tv_result]}
+            mock_search_class.return_value = mock_search
+
+            results = await matcher.search_tmdb(title="Breaking Bad", media_type="tv")
+
+            assert not any(key.startswith("_") for key in results[0])
+
     async def test_search_tmdb_uses_cache(self, mock_tmdb_movie_result):
         """Test that TMDb search uses cache when available."""
         cache = AsyncMock()
@@ -95,6 +152,44 @@ class TestMediaMatcher:
             # Verify API was NOT called
             mock_search.movie.assert_not_called()
 
+    async def test_search_tmdb_coalesces_concurrent_duplicates(self, mock_tmdb_movie_result):
+        """Test that concurrent identical searches share a single TMDb request."""
+        matcher = MediaMatcher(tmdb_api_key="test-key")
+
+        with patch("tmdbsimple.Search") as mock_search_class:
+            mock_search = MagicMock()
+            mock_search.movie.return_value = {"results": [mock_tmdb_movie_result]}
+            mock_search_class.return_value = mock_search
+
+            first, second = await asyncio.gather(
+                matcher.search_tmdb(title="Inception", year=2010, media_type="movie"),
+                matcher.search_tmdb(title="inception", year=2010, media_type="movie"),
+            )
+
+            assert first[0]["id"] == second[0]["id"] == 27205
+            assert mock_search.movie.call_count == 1
+            assert matcher._inflight == {}
+
+    async def test_search_tmdb_runs_on_shared_tmdb_pool(self, mock_tmdb_movie_result):
+        """Test that blocking tmdbsimple calls run on the dedicated TMDb pool."""
+        import threading
+
+        matcher = MediaMatcher(tmdb_api_key="test-key")
+        thread_names = []
+
+        def fake_movie(**kwargs):
+            thread_names.append(threading.current_thread().name)
+            return {"results": [mock_tmdb_movie_result]}
+
+        with patch("tmdbsimple.Search") as mock_search_class:
+            mock_search = MagicMock()
+            mock_search.movie.side_effect = fake_movie
+            mock_search_class.return_value = mock_search
+
+            await matcher.search_tmdb(title="Inception", year=2010, media_type="movie")
+
+        assert thread_names and thread_names[0].startswith("tmdb")
+
     async def test_search_tmdb_raises_after_retries(self):
         """search_tmdb should raise after exhausting retry attempts."""
         cache = AsyncMock()
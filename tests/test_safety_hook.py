@@ -5,6 +5,7 @@ Tests classification of tools into READ/WRITE/BLOCKED tiers
 and verification that blocked operations are denied.
 """
 
+import json
 import pytest
 import sys
 from pathlib import Path
@@ -19,6 +20,8 @@ from hooks.safety import (
     should_allow_operation,
     get_confirmation_message,
     safety_hook,
+    TOOL_SAFETY_MAP,
+    _SAFETY_TABLE,
 )
 
 
@@ -278,5 +281,42 @@ class TestEdgeCases:
         assert result["requires_confirmation"] is True
 
 
+    def test_safety_table_is_read_only(self):
+        """The precomputed safety table must not be mutable at runtime."""
+        with pytest.raises(TypeError):
+            _SAFETY_TABLE["delete_file"] = (SafetyTier.READ, True, None, None)
+        assert classify_tool_safety("delete_file", {}) == SafetyTier.BLOCKED
+
+    def test_results_are_independent_json_serializable_dicts(self):
+        """Every tier returns a plain dict callers can serialize and modify."""
+        for name in ("list_libraries", "delete_file", "scan_library"):
+            result = safety_hook(name, {})
+            assert type(result) is dict
+            json.dumps(result)
+
+        first = safety_hook("list_libraries", {})
+        first["allowed"] = False
+        first["extra"] = 1
+        assert safety_hook("list_libraries", {"x": 1}) == {
+            "tier": "read",
+            "allowed": True,
+            "reason": None,
+            "requires_confirmation": False,
+            "confirmation_message": None,
+        }
+
+    def test_all_blocked_tools_are_denied(self):
+        """Every BLOCKED tool should get the same deny fields."""
+        blocked = [n for n, t in TOOL_SAFETY_MAP.items() if t == SafetyTier.BLOCKED]
+        for name in blocked:
+            result = safety_hook(name, {"path": "/x"})
+            assert result["tier"] == "blocked"
+            assert result["allowed"] is False
+            assert result["requires_confirmation"] is False
+            assert result["confirmation_message"] is None
+            assert result["reason"] == safety_hook(blocked[0], {})["reason"]
+            assert "blocked" in result["reason"].lower()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
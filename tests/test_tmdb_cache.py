@@ -258,3 +258,25 @@ class TestTMDbCache:
         assert stats["tv_count"] >= 1
 
         await cache.close()
+
+    async def test_large_result_round_trip(self, temp_dir, mock_tmdb_movie_result):
+        """Test that large payloads (compressed when zstandard is installed) round-trip."""
+        from server import tmdb_cache
+
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+
+        results = [dict(mock_tmdb_movie_result, id=i) for i in range(200)]
+        await cache.store("Inception", 2010, "movie", results)
+
+        cursor = await cache._conn.execute("SELECT result FROM tmdb_cache")
+        (raw,) = await cursor.fetchone()
+        if tmdb_cache.zstandard is not None:
+            assert isinstance(raw, bytes)
+        else:
+            assert isinstance(raw, str)
+
+        assert await cache.get("Inception", 2010, "movie") == results
+
+        await cache.close()
@@ -1,13 +1,16 @@
 """Tests for discovery tools (find_new_seasons, discover_top_rated_content)."""
 
 import asyncio
+import io
 import json
+import re
 import sys
 import types
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from server.tools import discovery
 from server.tools.discovery import (
     find_new_seasons,
     discover_top_rated_content,
@@ -18,6 +21,7 @@ from server.tools.discovery import (
     _fetch_telegraph_review,
     _find_guardian_review_url_via_rss,
     _fetch_url_with_browser,
+    close_scrape_sessions,
 )
 
 
@@ -26,6 +30,22 @@ from server.tools.discovery import (
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_review_cache():
+    """Keep cached newspaper reviews from leaking between tests."""
+    discovery._REVIEW_CACHE.clear()
+    yield
+    discovery._REVIEW_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_curl_sessions():
+    """Tests share one event loop, so drop per-loop scrape sessions between them."""
+    discovery._curl_sessions.clear()
+    yield
+    discovery._curl_sessions.clear()
+
+
 @pytest.fixture
 def mock_plex_client():
     client = MagicMock()
@@ -226,6 +246,48 @@ async def test_find_new_seasons_fetches_tmdb_tv_details_when_search_lacks_season
     mock_tv.info.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_find_new_seasons_skips_tmdb_tv_details_when_search_has_seasons(
+    mock_plex_client, mock_matcher
+):
+    """find_new_seasons should not fetch TV details when the search payload has seasons."""
+    mock_tv = MagicMock()
+
+    with patch("tmdbsimple.TV", return_value=mock_tv):
+        result = await find_new_seasons(mock_plex_client, mock_matcher, section_id="2")
+
+    assert result["shows_with_new_seasons_count"] == 2
+    mock_tv.info.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_find_new_seasons_fetches_tmdb_tv_details_once_per_show_id(
+    mock_plex_client, mock_matcher
+):
+    """find_new_seasons should reuse TV details for duplicate TMDb IDs within a call."""
+    mock_plex_client.get_library_inventory = AsyncMock(return_value=[
+        {"title": "Breaking Bad", "year": 2008, "rating_key": "101", "seasons": [1, 2], "episode_count": 20},
+        {"title": "Breaking Bad", "year": 2008, "rating_key": "102", "seasons": [3], "episode_count": 13},
+    ])
+
+    async def search_without_seasons(title, year=None, media_type="movie", **kwargs):
+        return [{"id": 1396, "name": "Breaking Bad", "media_type": "tv"}]
+
+    mock_matcher.search_tmdb = search_without_seasons
+
+    mock_tv = MagicMock()
+    mock_tv.info = MagicMock(return_value={
+        "id": 1396,
+        "seasons": [{"season_number": n} for n in range(1, 6)],
+    })
+
+    with patch("tmdbsimple.TV", return_value=mock_tv):
+        result = await find_new_seasons(mock_plex_client, mock_matcher, section_id="2")
+
+    assert result["shows_with_new_seasons_count"] == 2
+    mock_tv.info.assert_called_once()
+
+
 # =============================================================================
 # discover_top_rated_content tests
 # =============================================================================
@@ -429,6 +491,51 @@ async def test_fetch_newspaper_reviews_both_fail_returns_empty():
     assert result == {}
 
 
+@pytest.mark.asyncio
+async def test_fetch_newspaper_reviews_fetches_sources_concurrently():
+    """_fetch_newspaper_reviews should overlap the Guardian and Telegraph fetches."""
+    loop = asyncio.get_event_loop()
+
+    guardian_started = asyncio.Event()
+    telegraph_started = asyncio.Event()
+
+    # Each fetch waits for the other to start, so sequential fetches deadlock
+    async def guardian(title, year, loop):
+        guardian_started.set()
+        await telegraph_started.wait()
+        return {"score": 8.0, "url": "g", "headline": "", "source": "guardian"}
+
+    async def telegraph(title, year, loop):
+        telegraph_started.set()
+        await guardian_started.wait()
+        return {"score": 6.0, "url": "t", "source": "telegraph"}
+
+    with patch("server.tools.discovery._fetch_guardian_review", new=guardian), \
+         patch("server.tools.discovery._fetch_telegraph_review", new=telegraph):
+        result = await asyncio.wait_for(_fetch_newspaper_reviews("Oppenheimer", 2023, loop), timeout=5)
+
+    assert result["guardian"] == 8.0
+    assert result["telegraph"] == 6.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_newspaper_reviews_caches_per_title_and_year():
+    """Repeated lookups for the same (title, year) should not re-fetch, misses included."""
+    loop = asyncio.get_event_loop()
+
+    fetch = AsyncMock(return_value=None)
+    with patch("server.tools.discovery._find_guardian_review_url_via_rss",
+               new=AsyncMock(return_value=None)), \
+         patch("server.tools.discovery._fetch_url_with_browser", new=fetch):
+        first = await _fetch_newspaper_reviews("Oppenheimer", 2023, loop)
+        calls_after_first = fetch.await_count
+        second = await _fetch_newspaper_reviews("oppenheimer", 2023, loop)
+
+    assert first == second == {}
+    assert calls_after_first == 2  # Guardian search + Telegraph search
+    assert fetch.await_count == calls_after_first
+
+
 # ---------------------------------------------------------------------------
 # _parse_guardian_jsonld unit tests
 # ---------------------------------------------------------------------------
@@ -633,6 +740,17 @@ async def test_discover_newspaper_reviews_disabled(mock_plex_client, mock_matche
 # =============================================================================
 
 
+def _serve_body(body: str):
+    """Stand-in for urllib.request.urlopen that serves a fixed response body.
+
+    io.BytesIO already supports the ``with ... as resp: resp.read()`` protocol
+    the production code uses, so no MagicMock context-manager plumbing is needed.
+    """
+    def fake_urlopen(req, timeout=None):
+        return io.BytesIO(body.encode())
+    return fake_urlopen
+
+
 @pytest.mark.asyncio
 async def test_find_guardian_review_url_via_rss_matches_title():
     """_find_guardian_review_url_via_rss should return the link for a matching review item."""
@@ -651,14 +769,7 @@ async def test_find_guardian_review_url_via_rss_matches_title():
   </channel>
 </rss>"""
 
-    def fake_urlopen(req, timeout=None):
-        mock_resp = MagicMock()
-        mock_resp.__enter__.return_value = mock_resp
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_resp.read.return_value = rss_xml.encode()
-        return mock_resp
-
-    with patch("urllib.request.urlopen", side_effect=fake_urlopen):
+    with patch("urllib.request.urlopen", new=_serve_body(rss_xml)):
         url = await _find_guardian_review_url_via_rss("Dune: Part Two")
 
     assert url == "https://www.theguardian.com/film/2024/feb/27/dune-part-two-review"
@@ -677,14 +788,7 @@ async def test_find_guardian_review_url_via_rss_returns_none_when_no_match():
   </channel>
 </rss>"""
 
-    def fake_urlopen(req, timeout=None):
-        mock_resp = MagicMock()
-        mock_resp.__enter__.return_value = mock_resp
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_resp.read.return_value = rss_xml.encode()
-        return mock_resp
-
-    with patch("urllib.request.urlopen", side_effect=fake_urlopen):
+    with patch("urllib.request.urlopen", new=_serve_body(rss_xml)):
         url = await _find_guardian_review_url_via_rss("Oppenheimer")
 
     assert url is None
@@ -716,14 +820,7 @@ async def test_find_guardian_review_url_via_rss_avoids_partial_title_matches():
   </channel>
 </rss>"""
 
-    def fake_urlopen(req, timeout=None):
-        mock_resp = MagicMock()
-        mock_resp.__enter__.return_value = mock_resp
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_resp.read.return_value = rss_xml.encode()
-        return mock_resp
-
-    with patch("urllib.request.urlopen", side_effect=fake_urlopen):
+    with patch("urllib.request.urlopen", new=_serve_body(rss_xml)):
         url = await _find_guardian_review_url_via_rss("Her")
 
     assert url is None
@@ -799,6 +896,73 @@ async def test_fetch_url_with_browser_uses_curl_cffi_fast_path():
     assert result == "<html><body>content</body></html>"
 
 
+@pytest.mark.asyncio
+async def test_fetch_url_with_browser_reuses_curl_cffi_session():
+    """Consecutive fetches should share one pooled curl-cffi session."""
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.text = "<html><body>content</body></html>"
+
+    mock_session = MagicMock()
+    mock_session.get = AsyncMock(return_value=mock_resp)
+    mock_session.close = AsyncMock()
+
+    curl_cffi_module = types.ModuleType("curl_cffi")
+    curl_requests_module = types.ModuleType("curl_cffi.requests")
+    curl_requests_module.AsyncSession = MagicMock(return_value=mock_session)
+    curl_cffi_module.requests = curl_requests_module
+
+    with patch.dict(
+        sys.modules,
+        {"curl_cffi": curl_cffi_module, "curl_cffi.requests": curl_requests_module},
+    ):
+        await _fetch_url_with_browser("https://www.theguardian.com/search?q=x")
+        await _fetch_url_with_browser("https://www.theguardian.com/film/2023/x")
+        await close_scrape_sessions()
+
+    assert curl_requests_module.AsyncSession.call_count == 1
+    assert mock_session.get.await_count == 2
+    mock_session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_with_browser_streams_until_stop_pattern():
+    """With stop_at, curl-cffi should stop reading once the pattern has matched."""
+    chunks_read = []
+
+    async def aiter_content():
+        for chunk in (b"<html><head>", b'<a href="/film/2020/x">', b"<!-- rest of page -->"):
+            chunks_read.append(chunk)
+            yield chunk
+
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.aiter_content = aiter_content
+    mock_resp.aclose = AsyncMock()
+
+    mock_session = MagicMock()
+    mock_session.get = AsyncMock(return_value=mock_resp)
+
+    curl_cffi_module = types.ModuleType("curl_cffi")
+    curl_requests_module = types.ModuleType("curl_cffi.requests")
+    curl_requests_module.AsyncSession = MagicMock(return_value=mock_session)
+    curl_cffi_module.requests = curl_requests_module
+
+    with patch.dict(
+        sys.modules,
+        {"curl_cffi": curl_cffi_module, "curl_cffi.requests": curl_requests_module},
+    ):
+        result = await _fetch_url_with_browser(
+            "https://www.theguardian.com/search?q=x", stop_at=re.compile(r"/film/\d{4}/")
+        )
+        await close_scrape_sessions()
+
+    assert result == '<html><head><a href="/film/2020/x">'
+    assert len(chunks_read) == 2
+    assert mock_session.get.await_args.kwargs["stream"] is True
+    mock_resp.aclose.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_fetch_url_with_browser_escalates_to_crawl4ai_on_non_200():
     """_fetch_url_with_browser should fall through to crawl4ai when curl-cffi gets a non-200."""
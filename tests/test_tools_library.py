@@ -1,7 +1,6 @@
 """Tests for library MCP tools."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 from typing import Any, Dict, List
 
 from server.tools.library import (
@@ -70,10 +69,10 @@ async def test_list_libraries_error_handling(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_scan_library_success(mock_async_plex_client):
     """scan_library should trigger library scan."""
-    mock_async_plex_client.scan_library = AsyncMock(return_value={
+    mock_async_plex_client.scan_library.return_value = {
         "status": "success",
         "section_id": "1"
-    })
+    }
 
     result = await scan_library(mock_async_plex_client, "1")
 
@@ -88,9 +87,7 @@ async def test_scan_library_invalid_section(mock_async_plex_client):
     """scan_library should handle invalid section ID."""
     from plexapi.exceptions import NotFound
 
-    mock_async_plex_client.scan_library = AsyncMock(
-        side_effect=NotFound("Section not found")
-    )
+    mock_async_plex_client.scan_library.side_effect = NotFound("Section not found")
 
     with pytest.raises(NotFound, match="Section not found"):
         await scan_library(mock_async_plex_client, "999")
@@ -99,10 +96,10 @@ async def test_scan_library_invalid_section(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_scan_library_string_section_id(mock_async_plex_client):
     """scan_library should accept string section_id."""
-    mock_async_plex_client.scan_library = AsyncMock(return_value={
+    mock_async_plex_client.scan_library.return_value = {
         "status": "success",
         "section_id": "1"
-    })
+    }
 
     result = await scan_library(mock_async_plex_client, "1")
 
@@ -118,13 +115,13 @@ async def test_scan_library_string_section_id(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_search_library_success(mock_async_plex_client):
     """search_library should return matching items."""
-    mock_async_plex_client.search_library = AsyncMock(return_value=[
+    mock_async_plex_client.search_library.return_value = [
         {
             "title": "Inception",
             "year": 2010,
             "type": "movie"
         }
-    ])
+    ]
 
     result = await search_library(mock_async_plex_client, "1", "Inception")
 
@@ -140,7 +137,7 @@ async def test_search_library_success(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_search_library_no_results(mock_async_plex_client):
     """search_library should return empty list when no matches found."""
-    mock_async_plex_client.search_library = AsyncMock(return_value=[])
+    mock_async_plex_client.search_library.return_value = []
 
     result = await search_library(mock_async_plex_client, "1", "NonExistentMovie")
 
@@ -153,9 +150,7 @@ async def test_search_library_invalid_section(mock_async_plex_client):
     """search_library should handle invalid section ID."""
     from plexapi.exceptions import NotFound
 
-    mock_async_plex_client.search_library = AsyncMock(
-        side_effect=NotFound("Section not found")
-    )
+    mock_async_plex_client.search_library.side_effect = NotFound("Section not found")
 
     with pytest.raises(NotFound, match="Section not found"):
         await search_library(mock_async_plex_client, "999", "test")
@@ -164,7 +159,7 @@ async def test_search_library_invalid_section(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_search_library_empty_query(mock_async_plex_client):
     """search_library should handle empty query string."""
-    mock_async_plex_client.search_library = AsyncMock(return_value=[])
+    mock_async_plex_client.search_library.return_value = []
 
     result = await search_library(mock_async_plex_client, "1", "")
 
@@ -180,14 +175,14 @@ async def test_search_library_empty_query(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_list_recent_success(mock_async_plex_client):
     """list_recent should return recently added items."""
-    mock_async_plex_client.list_recent = AsyncMock(return_value=[
+    mock_async_plex_client.list_recent.return_value = [
         {
             "title": "The Matrix",
             "year": 1999,
             "type": "movie",
             "addedAt": 1609459200
         }
-    ])
+    ]
 
     result = await list_recent(mock_async_plex_client, "1", 10)
 
@@ -204,7 +199,7 @@ async def test_list_recent_success(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_list_recent_default_limit(mock_async_plex_client):
     """list_recent should use default limit of 20."""
-    mock_async_plex_client.list_recent = AsyncMock(return_value=[])
+    mock_async_plex_client.list_recent.return_value = []
 
     result = await list_recent(mock_async_plex_client, "1")
 
@@ -214,7 +209,7 @@ async def test_list_recent_default_limit(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_list_recent_custom_limit(mock_async_plex_client):
     """list_recent should accept custom limit."""
-    mock_async_plex_client.list_recent = AsyncMock(return_value=[])
+    mock_async_plex_client.list_recent.return_value = []
 
     result = await list_recent(mock_async_plex_client, "1", 5)
 
@@ -226,9 +221,7 @@ async def test_list_recent_invalid_section(mock_async_plex_client):
     """list_recent should handle invalid section ID."""
     from plexapi.exceptions import NotFound
 
-    mock_async_plex_client.list_recent = AsyncMock(
-        side_effect=NotFound("Section not found")
-    )
+    mock_async_plex_client.list_recent.side_effect = NotFound("Section not found")
 
     with pytest.raises(NotFound, match="Section not found"):
         await list_recent(mock_async_plex_client, "999", 10)
@@ -237,7 +230,7 @@ async def test_list_recent_invalid_section(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_list_recent_empty_library(mock_async_plex_client):
     """list_recent should handle empty library."""
-    mock_async_plex_client.list_recent = AsyncMock(return_value=[])
+    mock_async_plex_client.list_recent.return_value = []
 
     result = await list_recent(mock_async_plex_client, "1", 10)
 
@@ -253,7 +246,7 @@ async def test_list_recent_empty_library(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_get_library_inventory_success(mock_async_plex_client):
     """get_library_inventory should return shows with season lists."""
-    mock_async_plex_client.get_library_inventory = AsyncMock(return_value=[
+    mock_async_plex_client.get_library_inventory.return_value = [
         {
             "title": "Breaking Bad",
             "year": 2008,
@@ -268,7 +261,7 @@ async def test_get_library_inventory_success(mock_async_plex_client):
             "seasons": [1],
             "episode_count": 9,
         },
-    ])
+    ]
 
     result = await get_library_inventory(mock_async_plex_client, "2")
 
@@ -283,7 +276,7 @@ async def test_get_library_inventory_success(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_get_library_inventory_empty_section(mock_async_plex_client):
     """get_library_inventory should return empty list for an empty section."""
-    mock_async_plex_client.get_library_inventory = AsyncMock(return_value=[])
+    mock_async_plex_client.get_library_inventory.return_value = []
 
     result = await get_library_inventory(mock_async_plex_client, "2")
 
@@ -295,9 +288,7 @@ async def test_get_library_inventory_invalid_section(mock_async_plex_client):
     """get_library_inventory should propagate NotFound for invalid sections."""
     from plexapi.exceptions import NotFound
 
-    mock_async_plex_client.get_library_inventory = AsyncMock(
-        side_effect=NotFound("Section not found")
-    )
+    mock_async_plex_client.get_library_inventory.side_effect = NotFound("Section not found")
 
     with pytest.raises(NotFound):
         await get_library_inventory(mock_async_plex_client, "999")
@@ -311,14 +302,14 @@ async def test_get_library_inventory_invalid_section(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_get_show_details_success(mock_async_plex_client):
     """get_show_details should return season and episode detail."""
-    mock_async_plex_client.get_show_details = AsyncMock(return_value={
+    mock_async_plex_client.get_show_details.return_value = {
         "title": "The Wire",
         "year": 2002,
         "rating_key": "333",
         "seasons": [1, 2, 3, 4, 5],
         "episode_counts": {1: 13, 2: 12, 3: 12, 4: 13, 5: 10},
         "episode_count": 60,
-    })
+    }
 
     result = await get_show_details(mock_async_plex_client, "333")
 
@@ -1,5 +1,7 @@
 """Tests for NAS volume mount tools."""
 
+import asyncio
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
@@ -8,16 +10,26 @@ from server.tools.nas import (
     check_media_volume,
     mount_media_volume,
     ensure_media_volume_for_path,
+    NasMountSession,
+    NasConfig,
+    load_nas_config,
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_nas_config():
+    """Re-read NAS settings from the (patched) environment in every test."""
+    load_nas_config.cache_clear()
+    yield
+    load_nas_config.cache_clear()
+
+
 # =============================================================================
 # check_media_volume tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_check_volume_mounted_and_accessible(tmp_path):
+def test_check_volume_mounted_and_accessible(tmp_path):
     """check_media_volume should report mounted=True when path exists and is readable."""
     # Create a dummy file so iterdir() finds something
     (tmp_path / "dummy.txt").write_text("x")
@@ -28,15 +40,14 @@ async def test_check_volume_mounted_and_accessible(tmp_path):
         "VIDEODROME_NAS_MOUNT_POINT": str(tmp_path),
     }
     with patch.dict("os.environ", env, clear=False):
-        result = await check_media_volume()
+        result = check_media_volume()
 
     assert result["mounted"] is True
     assert result["accessible"] is True
     assert "hint" not in result
 
 
-@pytest.mark.asyncio
-async def test_check_volume_not_mounted(tmp_path):
+def test_check_volume_not_mounted(tmp_path):
     """check_media_volume should report mounted=False for non-existent path."""
     missing = tmp_path / "nonexistent"
 
@@ -46,15 +57,14 @@ async def test_check_volume_not_mounted(tmp_path):
         "VIDEODROME_NAS_MOUNT_POINT": str(missing),
     }
     with patch.dict("os.environ", env, clear=False):
-        result = await check_media_volume()
+        result = check_media_volume()
 
     assert result["mounted"] is False
     assert result["accessible"] is False
     assert "hint" in result
 
 
-@pytest.mark.asyncio
-async def test_check_volume_includes_nas_details():
+def test_check_volume_includes_nas_details():
     """check_media_volume should include NAS IP and share name in response."""
     env = {
         "VIDEODROME_NAS_IP": "192.168.1.50",
@@ -62,12 +72,35 @@ async def test_check_volume_includes_nas_details():
         "VIDEODROME_NAS_MOUNT_POINT": "/nonexistent/path",
     }
     with patch.dict("os.environ", env, clear=False):
-        result = await check_media_volume()
+        result = check_media_volume()
 
     assert result["nas_ip"] == "192.168.1.50"
     assert result["share_name"] == "DATA"
 
 
+def test_check_volume_accepts_explicit_config(tmp_path):
+    """check_media_volume should use a passed NasConfig instead of the environment."""
+    config = NasConfig(
+        nas_ip="10.0.0.2", share_name="TV", mount_point=tmp_path, auto_mount=True
+    )
+    with patch.dict("os.environ", {"VIDEODROME_NAS_IP": "10.9.8.15"}, clear=False):
+        result = check_media_volume(config)
+
+    assert result["nas_ip"] == "10.0.0.2"
+    assert result["share_name"] == "TV"
+    assert result["auto_mount_enabled"] is True
+
+
+def test_load_nas_config_is_cached():
+    """load_nas_config should read the environment once until cache_clear()."""
+    with patch.dict("os.environ", {"VIDEODROME_NAS_IP": "10.9.8.15"}, clear=False):
+        first = load_nas_config()
+    with patch.dict("os.environ", {"VIDEODROME_NAS_IP": "10.0.0.99"}, clear=False):
+        assert load_nas_config() is first
+        load_nas_config.cache_clear()
+        assert load_nas_config().nas_ip == "10.0.0.99"
+
+
 @pytest.mark.asyncio
 async def test_ensure_media_volume_for_path_skips_when_auto_mount_disabled(tmp_path):
     """ensure_media_volume_for_path should no-op when auto-mount is disabled."""
@@ -107,6 +140,49 @@ async def test_ensure_media_volume_for_path_attempts_mount_when_enabled(tmp_path
     mock_mount.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_nas_mount_session_mounts_once_for_many_paths(tmp_path):
+    """NasMountSession should mount at most once across a batch of paths."""
+    mount_point = tmp_path / "MEDIA"
+    targets = [mount_point / "Movies" / f"file{i}.mkv" for i in range(3)]
+
+    env = {
+        "VIDEODROME_NAS_IP": "10.9.8.15",
+        "VIDEODROME_NAS_SHARE": "MEDIA",
+        "VIDEODROME_NAS_MOUNT_POINT": str(mount_point),
+        "VIDEODROME_NAS_AUTO_MOUNT": "true",
+    }
+    with patch.dict("os.environ", env, clear=False), \
+         patch("server.tools.nas.mount_media_volume", new_callable=AsyncMock) as mock_mount:
+        mock_mount.return_value = {"success": True, "mounted": True, "path": str(mount_point)}
+        async with NasMountSession() as nas:
+            results = [await nas.ensure(t) for t in targets]
+            outside = await nas.ensure(tmp_path / "elsewhere.mkv")
+
+    assert results[0]["attempted"] is True
+    assert [r["reason"] for r in results[1:]] == ["already_mounted", "already_mounted"]
+    assert outside["reason"] == "path_outside_mount_point"
+    mock_mount.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_nas_mount_session_skips_mount_when_already_accessible(tmp_path):
+    """NasMountSession should not mount when the volume is already readable on entry."""
+    (tmp_path / "file.txt").write_text("x")
+
+    env = {
+        "VIDEODROME_NAS_MOUNT_POINT": str(tmp_path),
+        "VIDEODROME_NAS_AUTO_MOUNT": "true",
+    }
+    with patch.dict("os.environ", env, clear=False), \
+         patch("server.tools.nas.mount_media_volume", new_callable=AsyncMock) as mock_mount:
+        async with NasMountSession() as nas:
+            result = await nas.ensure(tmp_path / "Movies" / "file.mkv")
+
+    assert result == {"attempted": False, "reason": "already_mounted"}
+    mock_mount.assert_not_awaited()
+
+
 # =============================================================================
 # mount_media_volume tests
 # =============================================================================
@@ -146,6 +222,7 @@ async def test_mount_volume_macos_calls_open():
     """mount_media_volume on macOS should call 'open smb://…' (force_remount bypasses already-mounted check)."""
     mock_proc = MagicMock()
     mock_proc.returncode = 0
+    mock_proc.communicate = AsyncMock(return_value=(b"", b""))
 
     env = {
         "VIDEODROME_NAS_IP": "10.9.8.15",
@@ -155,14 +232,15 @@ async def test_mount_volume_macos_calls_open():
 
     with patch.dict("os.environ", env, clear=False), \
          patch("platform.system", return_value="Darwin"), \
-         patch("subprocess.run", return_value=mock_proc) as mock_run, \
+         patch("asyncio.create_subprocess_exec", new_callable=AsyncMock,
+               return_value=mock_proc) as mock_exec, \
          patch("pathlib.Path.exists", return_value=True), \
          patch("asyncio.sleep", new_callable=AsyncMock):
         # force_remount=True skips the "already mounted" early return
         result = await mount_media_volume(force_remount=True)
 
-    mock_run.assert_called_once()
-    call_args = mock_run.call_args[0][0]  # positional args list
+    mock_exec.assert_awaited_once()
+    call_args = mock_exec.call_args[0]  # positional args
     assert call_args[0] == "open"
     assert "smb://10.9.8.15/MEDIA" in call_args[1]
 
@@ -172,7 +250,31 @@ async def test_mount_volume_subprocess_failure():
     """mount_media_volume should return success=False on non-zero returncode."""
     mock_proc = MagicMock()
     mock_proc.returncode = 1
-    mock_proc.stderr = "Host not found"
+    mock_proc.communicate = AsyncMock(return_value=(b"", b"Host not found"))
+
+    env = {
+        "VIDEODROME_NAS_IP": "10.9.8.15",
+        "VIDEODROME_NAS_SHARE": "MEDIA",
+        "VIDEODROME_NAS_MOUNT_POINT": "/Volumes/NONEXISTENT",
+    }
+
+    with patch.dict("os.environ", env, clear=False), \
+         patch("platform.system", return_value="Darwin"), \
+         patch("asyncio.create_subprocess_exec", new_callable=AsyncMock,
+               return_value=mock_proc), \
+         patch("pathlib.Path.exists", return_value=False):
+        result = await mount_media_volume()
+
+    assert result["success"] is False
+    assert "Host not found" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_mount_volume_timeout_kills_process():
+    """A hung mount command should be killed and reported as a timeout."""
+    mock_proc = MagicMock()
+    mock_proc.communicate = AsyncMock(side_effect=asyncio.TimeoutError)
+    mock_proc.wait = AsyncMock(return_value=-9)
 
     env = {
         "VIDEODROME_NAS_IP": "10.9.8.15",
@@ -182,9 +284,11 @@ async def test_mount_volume_subprocess_failure():
 
     with patch.dict("os.environ", env, clear=False), \
          patch("platform.system", return_value="Darwin"), \
-         patch("subprocess.run", return_value=mock_proc), \
+         patch("asyncio.create_subprocess_exec", new_callable=AsyncMock,
+               return_value=mock_proc), \
          patch("pathlib.Path.exists", return_value=False):
         result = await mount_media_volume()
 
+    mock_proc.kill.assert_called_once()
     assert result["success"] is False
-    assert "error" in result
+    assert "timed out" in result["error"]
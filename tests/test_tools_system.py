@@ -1,7 +1,6 @@
 """Tests for system MCP tools."""
 
 import pytest
-from unittest.mock import AsyncMock
 from typing import Any, Dict
 
 from server.tools.system import get_server_info
@@ -28,13 +27,13 @@ async def test_get_server_info_success(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_get_server_info_complete_fields(mock_async_plex_client):
     """get_server_info should return all expected fields."""
-    mock_async_plex_client.get_server_info = AsyncMock(return_value={
+    mock_async_plex_client.get_server_info.return_value = {
         "name": "Test Plex Server",
         "version": "1.40.0.0000-deadbeef",
         "platform": "Linux",
         "machineIdentifier": "test-machine-id",
         "updatedAt": 1609459200
-    })
+    }
 
     result = await get_server_info(mock_async_plex_client)
 
@@ -48,9 +47,7 @@ async def test_get_server_info_complete_fields(mock_async_plex_client):
 @pytest.mark.asyncio
 async def test_get_server_info_error_handling(mock_async_plex_client):
     """get_server_info should raise exception on connection error."""
-    mock_async_plex_client.get_server_info = AsyncMock(
-        side_effect=Exception("Connection failed")
-    )
+    mock_async_plex_client.get_server_info.side_effect = Exception("Connection failed")
 
     with pytest.raises(Exception, match="Connection failed"):
         await get_server_info(mock_async_plex_client)
@@ -61,9 +58,7 @@ async def test_get_server_info_unauthorized(mock_async_plex_client):
     """get_server_info should handle unauthorized access."""
     from plexapi.exceptions import Unauthorized
 
-    mock_async_plex_client.get_server_info = AsyncMock(
-        side_effect=Unauthorized("Invalid token")
-    )
+    mock_async_plex_client.get_server_info.side_effect = Unauthorized("Invalid token")
 
     with pytest.raises(Unauthorized, match="Invalid token"):
         await get_server_info(mock_async_plex_client)
@@ -74,9 +69,7 @@ async def test_get_server_info_timeout(mock_async_plex_client):
     """get_server_info should handle timeout."""
     import asyncio
 
-    mock_async_plex_client.get_server_info = AsyncMock(
-        side_effect=asyncio.TimeoutError("Request timeout")
-    )
+    mock_async_plex_client.get_server_info.side_effect = asyncio.TimeoutError("Request timeout")
 
     with pytest.raises(asyncio.TimeoutError):
         await get_server_info(mock_async_plex_client)
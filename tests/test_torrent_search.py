@@ -1,6 +1,9 @@
 """Tests for torrent search client and tools."""
 
+import asyncio
+
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from server.torrent_search import TorrentSearchClient
@@ -39,6 +42,19 @@ def test_connect_returns_true_when_library_present():
     assert client.is_available is True
 
 
+def test_connect_caches_api_class_for_later_use():
+    """The API class resolved by connect() should be reused without re-importing."""
+    client = TorrentSearchClient()
+    wrapper = MagicMock()
+    with patch.dict("sys.modules", {"torrent_search": MagicMock(), "torrent_search.wrapper": wrapper}):
+        assert client.connect() is True
+
+    # Import machinery is no longer patched; _get_api must use the cached class
+    api = client._get_api()
+    assert api is wrapper.TorrentSearchApi.return_value
+    assert client._get_api() is api
+
+
 @pytest.mark.asyncio
 async def test_client_search_filters_to_configured_providers():
     """search() should keep only results from configured providers."""
@@ -60,29 +76,122 @@ async def test_client_search_filters_to_configured_providers():
     assert results[0]["source"] == "tpb"
 
 
+class _LegacyApi:
+    """API without a providers argument (older torrent-search-mcp)."""
+
+    async def search_torrents(self, query, max_items=10):
+        raise AssertionError("replaced per test")
+
+
+class _ProviderAwareApi:
+    """API that can restrict the upstream search to given providers."""
+
+    async def search_torrents(self, query, providers=None, max_items=10):
+        raise AssertionError("replaced per test")
+
+
 @pytest.mark.asyncio
-async def test_client_search_falls_back_when_provider_kw_not_supported():
-    """search() should retry without provider kwarg on older torrent-search versions."""
+async def test_client_search_omits_provider_kw_when_not_supported():
+    """search() should make one call without providers= on older APIs."""
     client = TorrentSearchClient(providers=["nyaa"])
+    client._set_api_cls(_LegacyApi)
+    upstream = AsyncMock(return_value=[{"id": "n1", "title": "Nyaa result", "source": "nyaa"}])
+    client._api = MagicMock(search_torrents=upstream)
+
+    results = await client.search("anime", limit=5)
+
+    assert [r["id"] for r in results] == ["n1"]
+    upstream.assert_awaited_once_with("anime", max_items=5)
+
+
+@pytest.mark.asyncio
+async def test_client_search_passes_providers_when_supported():
+    """search() should forward configured providers when the API accepts them."""
+    client = TorrentSearchClient(providers=["nyaa"])
+    client._set_api_cls(_ProviderAwareApi)
+    upstream = AsyncMock(return_value=[])
+    client._api = MagicMock(search_torrents=upstream)
+
+    await client.search("anime", limit=5)
+
+    upstream.assert_awaited_once_with("anime", providers=["nyaa"], max_items=5)
+
+
+def test_provider_allow_list_expands_aliases():
+    """Configured providers should accept their known source aliases only."""
+    client = TorrentSearchClient(providers=["ThePirateBay", "nyaa"])
+    assert client._allowed_sources == frozenset(
+        {"thepiratebay", "tpb", "thepiratebay.org", "nyaa", "nyaa.si"}
+    )
+    assert client._is_provider_allowed(" TPB ") is True
+    assert client._is_provider_allowed("ygg") is False
+
+
+def _client_with_api(search_torrents):
+    client = TorrentSearchClient(providers=["thepiratebay"])
     client._is_available = True
+    client._api = MagicMock()
+    client._api.search_torrents = search_torrents
+    return client
 
-    mock_ts = MagicMock()
 
-    def fake_search(*args, **kwargs):
-        if "providers" in kwargs:
-            raise TypeError("unexpected keyword argument 'providers'")
-        return [{"id": "n1", "title": "Nyaa result", "source": "nyaa", "seeders": 15}]
+@pytest.mark.asyncio
+async def test_client_search_filters_then_limits():
+    """Provider filtering should happen before the result limit is applied."""
+    upstream = AsyncMock(return_value=[
+        {"id": "n1", "title": "N1", "source": "nyaa"},
+        {"id": "t1", "title": "T1", "source": "tpb"},
+        {"id": "n2", "title": "N2", "source": "nyaa"},
+        {"id": "t2", "title": "T2", "source": "thepiratebay"},
+        {"id": "t3", "title": "T3", "source": "tpb"},
+    ])
+    client = _client_with_api(upstream)
 
-    mock_ts.search.side_effect = fake_search
-    mock_module = MagicMock()
-    mock_module.TorrentSearch = MagicMock(return_value=mock_ts)
+    results = await client.search("x", limit=2)
 
-    with patch.dict("sys.modules", {"torrent_search": mock_module}):
-        results = await client.search("anime", limit=5)
+    assert [r["id"] for r in results] == ["t1", "t2"]
 
-    assert len(results) == 1
-    assert results[0]["source"] == "nyaa"
-    assert mock_ts.search.call_count == 2
+
+@pytest.mark.asyncio
+async def test_client_search_caches_identical_queries():
+    """Repeated searches within the TTL should hit the upstream API once."""
+    upstream = AsyncMock(return_value=[{"id": "a", "title": "A", "source": "tpb"}])
+    client = _client_with_api(upstream)
+
+    first = await client.search("Dark S01", limit=5)
+    second = await client.search("  dark   s01 ", limit=5)
+
+    assert first == second
+    assert upstream.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_client_search_coalesces_concurrent_queries():
+    """Concurrent identical searches should share one upstream request."""
+    async def slow_search(query, max_items=10):
+        await asyncio.sleep(0.01)
+        return [{"id": "a", "title": "A", "source": "tpb"}]
+
+    upstream = AsyncMock(side_effect=slow_search)
+    client = _client_with_api(upstream)
+
+    results = await asyncio.gather(*(client.search("Dark", limit=5) for _ in range(5)))
+
+    assert all(r == results[0] for r in results)
+    assert upstream.await_count == 1
+    assert client._search_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_client_search_does_not_cache_errors():
+    """A failed upstream search should be retried on the next call."""
+    upstream = AsyncMock(side_effect=[RuntimeError("down"), []])
+    client = _client_with_api(upstream)
+
+    with pytest.raises(RuntimeError):
+        await client.search("Dark", limit=5)
+    assert await client.search("Dark", limit=5) == []
+    assert upstream.await_count == 2
 
 
 def test_rank_prefers_season_packs():
@@ -99,6 +208,17 @@ def test_rank_prefers_season_packs():
     assert "3" in pack_ids
 
 
+def test_rank_does_not_treat_tagged_episode_as_pack():
+    """A single SxxEyy release should not get the pack bonus for saying 'Season'."""
+    results = [
+        {"id": "ep", "title": "Dark Season 1 S01E03 1080p", "seeders": 300},
+        {"id": "pack", "title": "Dark Season 1 Complete 1080p", "seeders": 20},
+        {"id": "other", "title": "Dark S01E04 1080p", "seeders": 200},
+    ]
+    ranked = TorrentSearchClient.rank(results)
+    assert [r["id"] for r in ranked] == ["pack", "ep", "other"]
+
+
 def test_rank_sorts_by_seeders_within_same_category():
     """rank() should sort by seeder count when pack status is equal."""
     results = [
@@ -136,18 +256,17 @@ def test_normalise_casts_seeders_to_int():
 # =============================================================================
 
 
+# Plain namespaces stand in for the client: tool functions only touch
+# is_available, search and get_magnet, and tests assign AsyncMocks for the
+# latter two. This avoids building a spec'd MagicMock for every test.
 @pytest.fixture
 def available_client():
-    client = MagicMock(spec=TorrentSearchClient)
-    client.is_available = True
-    return client
+    return SimpleNamespace(is_available=True, search=None, get_magnet=None)
 
 
 @pytest.fixture
 def unavailable_client():
-    client = MagicMock(spec=TorrentSearchClient)
-    client.is_available = False
-    return client
+    return SimpleNamespace(is_available=False, search=None, get_magnet=None)
 
 
 @pytest.mark.asyncio
@@ -231,6 +350,51 @@ async def test_search_season_deduplicates_results(available_client):
     assert ids.count("dup-id") == 1
 
 
+@pytest.mark.asyncio
+async def test_search_season_runs_queries_concurrently(available_client):
+    """search_season should issue its query variants in parallel."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_search(query, limit=10):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return []
+
+    available_client.search = AsyncMock(side_effect=fake_search)
+
+    await search_season(available_client, "Dark", 1, language="de")
+
+    assert available_client.search.await_count > 2
+    assert peak == available_client.search.await_count
+
+
+@pytest.mark.asyncio
+async def test_search_season_skips_failed_query(available_client):
+    """One failing query variant should not discard results from the others."""
+    hit = {
+        "id": "ok", "title": "Dark S01 1080p", "seeders": 10, "leechers": 1,
+        "source": "tpb", "size": "5 GB", "date": "2024-01-01", "magnet": None,
+    }
+    available_client.search = AsyncMock(side_effect=[RuntimeError("boom"), [hit]])
+
+    result = await search_season(available_client, "Dark", 1)
+
+    assert [r["id"] for r in result["results"]] == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_search_season_raises_when_all_queries_fail(available_client):
+    """If every query variant fails the error should still surface."""
+    available_client.search = AsyncMock(side_effect=RuntimeError("offline"))
+
+    with pytest.raises(RuntimeError, match="offline"):
+        await search_season(available_client, "Dark", 1)
+
+
 @pytest.mark.asyncio
 async def test_search_season_structure(available_client):
     """search_season should return expected keys."""
@@ -282,6 +446,14 @@ def test_resolve_language_unknown_returns_none():
     assert _resolve_language("klingon") is None
 
 
+def test_resolve_language_is_memoised():
+    """Repeated lookups of the same input should be served from the cache."""
+    _resolve_language.cache_clear()
+    assert _resolve_language("Deutsch") == "de"
+    assert _resolve_language("Deutsch") == "de"
+    assert _resolve_language.cache_info().hits == 1
+
+
 def test_build_language_queries_german_adds_keywords():
     """_build_language_queries for 'de' should append German keywords to base queries."""
     base = ["Dark Season 1 1080p"]
@@ -327,6 +499,20 @@ def test_rank_with_language_prefers_german_tagged():
     assert ranked[0]["id"] == "2"  # German-tagged despite lower seeders
 
 
+def test_rank_with_language_matches_whole_tags_only():
+    """Short tags like GER/ITA should not match inside ordinary words."""
+    results = [
+        {"id": "tiger", "title": "Tiger King S01 1080p", "seeders": 100},
+        {"id": "ger", "title": "Dark_S01_GER_DL_1080p", "seeders": 10},
+    ]
+    assert [r["id"] for r in _rank_with_language(results, "de")] == ["ger", "tiger"]
+
+    italian = [{"id": "vita", "title": "La Dolce Vita 1960", "seeders": 5}]
+    assert _rank_with_language(italian + [
+        {"id": "ita", "title": "Gomorra S01 ITA 720p", "seeders": 1},
+    ], "it")[0]["id"] == "ita"
+
+
 def test_rank_with_language_none_falls_back_to_seeders():
     """_rank_with_language with no language should rank purely by seeders (+ pack bonus)."""
     results = [
@@ -388,3 +574,25 @@ async def test_search_torrents_english_no_language_key(available_client):
     result = await search_torrents(available_client, "Breaking Bad")
 
     assert "language" not in result
+
+
+@pytest.mark.asyncio
+async def test_search_torrents_blank_query_skips_search(available_client):
+    """A whitespace-only query should return no results without searching."""
+    available_client.search = AsyncMock()
+
+    result = await search_torrents(available_client, "   ")
+
+    assert result == {"results": [], "total": 0, "query": "   "}
+    available_client.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_search_season_blank_title_skips_search(available_client):
+    """search_season with an empty show title should not hit the providers."""
+    available_client.search = AsyncMock()
+
+    result = await search_season(available_client, "", 1)
+
+    assert result["results"] == [] and result["total"] == 0
+    available_client.search.assert_not_awaited()
@@ -15,6 +15,9 @@ def test_is_valid_torrent_reference():
     assert is_valid_torrent_reference("/tmp/file.torrent")
     assert not is_valid_torrent_reference("https://example.com/file.zip")
     assert not is_valid_torrent_reference("")
+    assert is_valid_torrent_reference("https://example.com/file.torrent#top")
+    assert not is_valid_torrent_reference("https://example.com/file.torrent.zip")
+    assert not is_valid_torrent_reference("https://example.com/get?file=x.torrent")
 
 
 @patch("server.transmission.transmission_rpc.Client")
@@ -108,3 +111,7 @@ def test_get_torrent_files_uses_get_files_api():
 
     torrent.get_files.assert_called_once()
     assert files == ["/downloads/Movie/example.mkv"]
+
+    # A trailing slash on the download dir must not produce a double separator
+    torrent.download_dir = "/downloads/"
+    assert client._get_torrent_files(torrent) == ["/downloads/Movie/example.mkv"]
@@ -2,10 +2,12 @@
 
 import pytest
 import asyncio
+import os
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch, call
-from server.watcher import IngestWatcher, FileStabilityChecker
+from watchdog.events import FileMovedEvent
+from server.watcher import IngestWatcher, FileStabilityChecker, IngestEventHandler, PendingItem, PendingQueue, WatcherState
 from server.matcher import MediaMatcher
 from server.files import FileManager
 from server.history import IngestHistory, IngestStatus
@@ -58,14 +60,15 @@ async def test_stability_checker_initialization(sample_video_file):
 @pytest.mark.asyncio
 async def test_stability_checker_stable_file(sample_video_file):
     """Test stability check passes for file with constant size."""
-    checker = FileStabilityChecker(sample_video_file, stability_seconds=1)
+    now = [0.0]
+    checker = FileStabilityChecker(sample_video_file, stability_seconds=1, clock=lambda: now[0])
 
     # Initial check
     is_stable = await checker.check()
     assert is_stable is False  # First check always returns False
 
-    # Wait for stability period plus a bit
-    await asyncio.sleep(1.2)
+    # Advance past the stability period
+    now[0] += 1.2
 
     # Second check after time passes
     is_stable = await checker.check()
@@ -73,6 +76,20 @@ async def test_stability_checker_stable_file(sample_video_file):
     assert checker.stable_size == sample_video_file.stat().st_size
 
 
+@pytest.mark.asyncio
+async def test_stability_checker_waits_for_full_window(sample_video_file):
+    """An unchanged file is not stable until the whole window has elapsed."""
+    now = [100.0]
+    checker = FileStabilityChecker(sample_video_file, stability_seconds=60, clock=lambda: now[0])
+
+    assert await checker.check() is False
+    now[0] += 59.9
+    assert await checker.check() is False
+    now[0] += 0.1
+    assert await checker.check() is True
+    assert checker.is_stable
+
+
 @pytest.mark.asyncio
 async def test_stability_checker_changing_file(temp_ingest_dir):
     """Test stability check fails for file with changing size."""
@@ -92,6 +109,23 @@ async def test_stability_checker_changing_file(temp_ingest_dir):
     assert is_stable is False
 
 
+@pytest.mark.asyncio
+async def test_stability_checker_same_size_rewrite_resets(temp_ingest_dir):
+    """A preallocated file rewritten in place (same size, new mtime) is not stable."""
+    test_file = temp_ingest_dir / "preallocated.mkv"
+    test_file.write_bytes(b"\0" * 64)
+
+    checker = FileStabilityChecker(test_file, stability_seconds=0)
+    await checker.check()
+
+    test_file.write_bytes(b"\1" * 64)
+    st = test_file.stat()
+    os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert await checker.check() is False
+    assert await checker.check() is True
+
+
 @pytest.mark.asyncio
 async def test_stability_checker_missing_file(temp_ingest_dir):
     """Test stability check handles missing file."""
@@ -148,6 +182,59 @@ async def test_watcher_start_stop(temp_ingest_dir, matcher, file_manager, histor
     assert watcher.observer is None
 
 
+@pytest.mark.asyncio
+async def test_watcher_concurrent_start_starts_once(temp_ingest_dir, matcher, file_manager, history_db):
+    """Racing start() calls should create a single observer."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db
+    )
+
+    with patch("server.watcher.Observer") as mock_observer_cls:
+        await asyncio.gather(watcher.start(), watcher.start())
+        assert mock_observer_cls.call_count == 1
+        assert watcher._state == WatcherState.RUNNING
+
+        await asyncio.gather(watcher.stop(), watcher.stop())
+
+    assert watcher._state == WatcherState.STOPPED
+    assert (await watcher.get_status())["state"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_event_handler_tracks_files_moved_into_ingest_dir(
+    temp_ingest_dir, matcher, file_manager, history_db
+):
+    """A rename into the ingest dir (e.g. .part -> .mkv) should start a stability check."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db
+    )
+    watcher._loop = asyncio.get_running_loop()
+    final = temp_ingest_dir / "Movie.2020.1080p.mkv"
+    final.write_text("test content")
+
+    handled = asyncio.Event()
+    handle_new_file = watcher._handle_new_file
+
+    async def handle_and_signal(file_path):
+        await handle_new_file(file_path)
+        handled.set()
+
+    watcher._handle_new_file = handle_and_signal
+
+    handler = IngestEventHandler(watcher)
+    handler.on_moved(FileMovedEvent(str(temp_ingest_dir / "Movie.2020.1080p.mkv.part"), str(final)))
+    await asyncio.wait_for(handled.wait(), timeout=5)
+
+    st = os.stat(final)
+    assert (st.st_dev, st.st_ino) in watcher._processing
+
+
 @pytest.mark.asyncio
 async def test_watcher_get_status(temp_ingest_dir, matcher, file_manager, history_db):
     """Test getting watcher status."""
@@ -184,9 +271,85 @@ async def test_watcher_handle_new_file(temp_ingest_dir, matcher, file_manager, h
     # Handle new file
     await watcher._handle_new_file(test_file)
 
-    # Should be in processing (stability check)
+    # Should be in processing (stability check), keyed by inode
+    st = os.stat(test_file)
+    assert (st.st_dev, st.st_ino) in watcher._processing
+
+
+@pytest.mark.asyncio
+async def test_watcher_follows_renamed_file(temp_ingest_dir, matcher, file_manager, history_db):
+    """A tracked file renamed mid-check should keep its checker and window."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db
+    )
+
+    original = temp_ingest_dir / "Inception.2010.1080p.mkv"
+    original.write_text("test content")
+    await watcher._handle_new_file(original)
+    (checker,) = watcher._processing.values()
+    checker.stable_since = 123.0
+
+    renamed = temp_ingest_dir / "Inception (2010).mkv"
+    original.rename(renamed)
+    await watcher._handle_new_file(renamed)
+
+    assert len(watcher._processing) == 1
+    assert checker.path == renamed
+    assert checker.stable_since == 123.0
+
+
+@pytest.mark.asyncio
+async def test_watcher_rekeys_file_first_seen_before_stat(temp_ingest_dir, matcher, file_manager, history_db):
+    """A file tracked by path before it existed should move to its inode key, not duplicate."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db
+    )
+
+    test_file = temp_ingest_dir / "Inception.2010.1080p.mkv"
+    await watcher._handle_new_file(test_file)
+    (checker,) = watcher._processing.values()
     assert test_file in watcher._processing
 
+    test_file.write_text("test content")
+    await watcher._handle_new_file(test_file)
+
+    st = os.stat(test_file)
+    assert list(watcher._processing) == [(st.st_dev, st.st_ino)]
+    assert watcher._processing[(st.st_dev, st.st_ino)] is checker
+
+
+@pytest.mark.asyncio
+async def test_stable_file_rekeyed_while_processing_is_forgotten(temp_ingest_dir, matcher, file_manager, history_db):
+    """A checker re-keyed during processing should still leave _processing afterwards."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db
+    )
+
+    test_file = temp_ingest_dir / "Inception.2010.1080p.mkv"
+    await watcher._handle_new_file(test_file)  # not there yet: tracked by path
+    (checker,) = watcher._processing.values()
+    test_file.write_text("test content")
+
+    async def rekey_during_processing(file_path):
+        await watcher._handle_new_file(file_path)
+
+    watcher._find_stable_files = AsyncMock(return_value=[checker])
+    watcher._process_stable_file = AsyncMock(side_effect=rekey_during_processing)
+
+    await watcher._process_stable_files()
+
+    watcher._process_stable_file.assert_awaited_once_with(test_file)
+    assert watcher._processing == {}
+
 
 @pytest.mark.asyncio
 async def test_watcher_auto_ingest_high_confidence(temp_ingest_dir, matcher, file_manager, history_db, mock_tmdb_movie_result):
@@ -390,6 +553,72 @@ async def test_watcher_get_pending_queue(temp_ingest_dir, matcher, file_manager,
     assert all("confidence" in item for item in queue)
 
 
+def test_pending_queue_remove_keeps_rows_consistent():
+    """Deleting a row should not mix up the remaining columns."""
+    queue = PendingQueue()
+    for i, name in enumerate(("a.mkv", "b.mkv", "c.mkv")):
+        queue[name] = {"source": name, "match": {"id": i}, "confidence": i / 10, "parsed": {"n": i}}
+
+    del queue["a.mkv"]
+
+    assert len(queue) == 2
+    assert "a.mkv" not in queue
+    assert queue["c.mkv"] == {"source": "c.mkv", "match": {"id": 2}, "confidence": 0.2, "parsed": {"n": 2}}
+    assert {row["source"]: row["match"]["id"] for row in queue.rows()} == {"b.mkv": 1, "c.mkv": 2}
+
+    queue["b.mkv"] = {"source": "b.mkv", "match": {"id": 9}, "confidence": 0.9}
+    assert len(queue) == 2
+    assert queue["b.mkv"] == {"source": "b.mkv", "match": {"id": 9}, "confidence": 0.9}
+
+
+def test_pending_queue_lists_in_arrival_order_after_middle_deletion():
+    """Approving/rejecting one item must not reorder the rest of the review list."""
+    queue = PendingQueue()
+    for i, name in enumerate(("a.mkv", "b.mkv", "c.mkv", "d.mkv")):
+        queue[name] = {"source": name, "match": {"id": i}, "confidence": i / 10}
+
+    del queue["b.mkv"]
+
+    assert [row["source"] for row in queue.rows()] == ["a.mkv", "c.mkv", "d.mkv"]
+    assert [row["match"]["id"] for row in queue.rows()] == [0, 2, 3]
+    assert queue["d.mkv"]["confidence"] == 0.3
+
+    del queue["a.mkv"]
+    queue["e.mkv"] = {"source": "e.mkv", "match": {"id": 4}, "confidence": 0.4}
+    assert [row["source"] for row in queue.rows()] == ["c.mkv", "d.mkv", "e.mkv"]
+
+
+def test_pending_queue_stores_pending_items_column_wise():
+    """PendingItem fields should round-trip, omitting unset optional ones."""
+    queue = PendingQueue()
+    item = PendingItem(
+        source="a.mkv", match={"id": 1}, confidence=0.5,
+        parsed={"title": "A"}, torrent_hash="abc", torrent_name="A Torrent"
+    )
+    queue["a.mkv"] = item
+    queue["b.mkv"] = PendingItem(source="b.mkv", match={"id": 2}, confidence=0.7)
+
+    assert queue["a.mkv"] == {
+        "source": "a.mkv", "match": {"id": 1}, "confidence": 0.5,
+        "parsed": {"title": "A"}, "torrent_hash": "abc", "torrent_name": "A Torrent"
+    }
+    assert queue["b.mkv"] == {"source": "b.mkv", "match": {"id": 2}, "confidence": 0.7}
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.confidence = 1.0
+
+
+def test_pending_queue_rows_filters_by_min_confidence():
+    """Only rows at or above the threshold should be materialised."""
+    queue = PendingQueue()
+    for name, confidence in (("a.mkv", 0.4), ("b.mkv", 0.8), ("c.mkv", 0.6)):
+        queue[name] = {"source": name, "match": {}, "confidence": confidence}
+
+    assert [row["source"] for row in queue.rows(0.6)] == ["b.mkv", "c.mkv"]
+    assert len(queue.rows()) == 3
+    assert queue.rows(0.9) == []
+
+
 @pytest.mark.asyncio
 async def test_watcher_stability_background_task(temp_ingest_dir, matcher, file_manager, history_db):
     """Test that stability check runs in background."""
@@ -418,6 +647,32 @@ async def test_watcher_stability_background_task(temp_ingest_dir, matcher, file_
     await watcher.stop()
 
 
+@pytest.mark.asyncio
+async def test_find_stable_files_batches_stats(temp_ingest_dir, matcher, file_manager, history_db):
+    """Stability sweeps should stat files in batches and skip missing ones."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db,
+        stability_seconds=0
+    )
+    files = []
+    for i in range(5):
+        f = temp_ingest_dir / f"file{i}.mkv"
+        f.write_text("data")
+        files.append(f)
+        await watcher._handle_new_file(f)
+    missing = temp_ingest_dir / "gone.mkv"
+    await watcher._handle_new_file(missing)
+
+    with patch("server.watcher.STAT_BATCH_SIZE", 2):
+        assert await watcher._find_stable_files() == []  # first sweep records fingerprints
+        stable = await watcher._find_stable_files()
+
+    assert [checker.path for checker in stable] == files
+
+
 @pytest.mark.asyncio
 async def test_watcher_duplicate_detection(temp_ingest_dir, matcher, file_manager, history_db, mock_tmdb_movie_result):
     """Test duplicate detection prevents re-ingesting."""
@@ -486,6 +741,26 @@ async def test_process_torrent_files_missing_file_not_marked_processed(
     assert result["mark_processed"] is False
 
 
+@pytest.mark.asyncio
+async def test_paths_exist_preserves_order_across_batches(
+    temp_ingest_dir, matcher, file_manager, history_db
+):
+    """Existence flags should line up with the input paths."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db
+    )
+
+    present = temp_ingest_dir / "present.mkv"
+    present.write_text("x")
+    paths = [str(present), str(temp_ingest_dir / "gone.mkv"), str(present)]
+
+    with patch("server.watcher.STAT_BATCH_SIZE", 2):
+        assert await watcher._paths_exist(paths) == [True, False, True]
+
+
 @pytest.mark.asyncio
 async def test_process_torrent_files_empty_list_marked_processed(
     temp_ingest_dir, matcher, file_manager, history_db
@@ -624,3 +899,20 @@ async def test_transmission_poll_loop_marks_processed_when_terminal(
             await watcher._transmission_poll_loop()
 
     assert "terminal-hash" in watcher._processed_torrent_hashes
+
+
+def test_processed_torrent_hashes_are_bounded(temp_ingest_dir, matcher, file_manager, history_db):
+    """Oldest processed hashes should be evicted once the cap is exceeded."""
+    watcher = IngestWatcher(
+        ingest_dir=temp_ingest_dir,
+        matcher=matcher,
+        file_manager=file_manager,
+        history=history_db
+    )
+
+    with patch("server.watcher.MAX_PROCESSED_TORRENT_HASHES", 3):
+        for h in ("a", "b", "c", "d"):
+            watcher._mark_torrent_processed(h)
+
+    assert "a" not in watcher._processed_torrent_hashes
+    assert list(watcher._processed_torrent_hashes) == ["b", "c", "d"]
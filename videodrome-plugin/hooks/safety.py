@@ -11,7 +11,8 @@ confirmation is required.
 """
 
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 class SafetyTier(Enum):
@@ -76,6 +77,82 @@ TOOL_SAFETY_MAP: dict[str, SafetyTier] = {
 }
 
 
+_BLOCKED_REASON = (
+    "This operation is blocked for safety reasons. "
+    "Deletion operations are not permitted through this plugin."
+)
+
+# Static confirmation prompts for WRITE tools
+_CONFIRMATION_MESSAGES: dict[str, str] = {
+    "scan_library": "Trigger a library scan? This will refresh Plex metadata and may be resource-intensive.",
+    "execute_naming_plan": "Execute renaming plan? Files will be moved and renamed on disk.",
+    "execute_ingest": "Execute full ingest pipeline? Files will be copied/moved to Plex libraries.",
+    "copy_file": "Copy file to Plex library? This will modify the filesystem.",
+    "rename_file": "Rename file? This will modify the filesystem.",
+    "move_file": "Move file? This will modify the filesystem.",
+    "approve_queue_item": "Approve and ingest this file? It will be processed and added to Plex.",
+    "reject_queue_item": "Reject this file? It will be removed from the ingest queue.",
+    "start_watcher": "Start file watcher? New files will be automatically processed based on confidence threshold.",
+    "stop_watcher": "Stop file watcher? Automatic file processing will be disabled.",
+    "restart_watcher": "Restart file watcher? This will stop and restart automatic file processing.",
+}
+
+# (tier, allowed, reason, base confirmation message)
+_SafetyEntry = tuple[SafetyTier, bool, str | None, str | None]
+
+
+def _base_confirmation_message(tool_name: str) -> str:
+    """Return the static confirmation prompt for a WRITE tool."""
+    message = _CONFIRMATION_MESSAGES.get(tool_name)
+    if message is None:
+        message = f"Execute {tool_name}? This operation will modify data or trigger actions."
+    return message
+
+
+def _build_entry(tool_name: str, tier: SafetyTier) -> _SafetyEntry:
+    """Precompute everything safety_hook needs for a tool of the given tier."""
+    if tier is SafetyTier.BLOCKED:
+        return tier, False, _BLOCKED_REASON, None
+    if tier is SafetyTier.WRITE:
+        return tier, True, None, _base_confirmation_message(tool_name)
+    return tier, True, None, None
+
+
+# Built once at import so safety_hook resolves a known tool in one lookup
+_SAFETY_TABLE: MappingProxyType[str, _SafetyEntry] = MappingProxyType({
+    name: _build_entry(name, tier) for name, tier in TOOL_SAFETY_MAP.items()
+})
+
+
+def _result_for(entry: _SafetyEntry, confirmation_message: str | None) -> dict[str, Any]:
+    """Build a safety_hook result dict from a table entry."""
+    tier, allowed, reason, _ = entry
+    return {
+        "tier": tier.value,
+        "allowed": allowed,
+        "reason": reason,
+        "requires_confirmation": tier is SafetyTier.WRITE,
+        "confirmation_message": confirmation_message,
+    }
+
+
+# READ and BLOCKED results depend on neither the tool name nor its arguments,
+# so safety_hook answers both tiers with a set probe and a copy of a
+# precomputed read-only template
+_BLOCKED_NAMES = frozenset(
+    name for name, tier in TOOL_SAFETY_MAP.items() if tier is SafetyTier.BLOCKED
+)
+_READ_NAMES = frozenset(
+    name for name, tier in TOOL_SAFETY_MAP.items() if tier is SafetyTier.READ
+)
+_BLOCKED_RESULT: Mapping[str, Any] = MappingProxyType(
+    _result_for(_build_entry("", SafetyTier.BLOCKED), None)
+)
+_READ_RESULT: Mapping[str, Any] = MappingProxyType(
+    _result_for(_build_entry("", SafetyTier.READ), None)
+)
+
+
 def classify_tool_safety(tool_name: str, tool_args: dict[str, Any]) -> SafetyTier:
     """
     Classify a tool operation into a safety tier.
@@ -90,11 +167,9 @@ def classify_tool_safety(tool_name: str, tool_args: dict[str, Any]) -> SafetyTie
     Raises:
         ValueError: If tool_name is not recognized
     """
-    if tool_name not in TOOL_SAFETY_MAP:
-        # Unknown tools default to WRITE (safe default: require confirmation)
-        return SafetyTier.WRITE
-
-    return TOOL_SAFETY_MAP[tool_name]
+    entry = _SAFETY_TABLE.get(tool_name)
+    # Unknown tools default to WRITE (safe default: require confirmation)
+    return entry[0] if entry is not None else SafetyTier.WRITE
 
 
 def should_allow_operation(tier: SafetyTier) -> tuple[bool, str | None]:
@@ -110,7 +185,7 @@ def should_allow_operation(tier: SafetyTier) -> tuple[bool, str | None]:
         - reason: Explanation if operation is blocked
     """
     if tier == SafetyTier.BLOCKED:
-        return False, "This operation is blocked for safety reasons. Deletion operations are not permitted through this plugin."
+        return False, _BLOCKED_REASON
 
     # READ and WRITE operations are allowed
     # (WRITE operations will trigger confirmation prompts at the MCP server level)
@@ -128,31 +203,22 @@ def get_confirmation_message(tool_name: str, tool_args: dict[str, Any]) -> str:
     Returns:
         Confirmation message string
     """
-    messages = {
-        "scan_library": "Trigger a library scan? This will refresh Plex metadata and may be resource-intensive.",
-        "execute_naming_plan": "Execute renaming plan? Files will be moved and renamed on disk.",
-        "execute_ingest": "Execute full ingest pipeline? Files will be copied/moved to Plex libraries.",
-        "copy_file": "Copy file to Plex library? This will modify the filesystem.",
-        "rename_file": "Rename file? This will modify the filesystem.",
-        "move_file": "Move file? This will modify the filesystem.",
-        "approve_queue_item": "Approve and ingest this file? It will be processed and added to Plex.",
-        "reject_queue_item": "Reject this file? It will be removed from the ingest queue.",
-        "start_watcher": "Start file watcher? New files will be automatically processed based on confidence threshold.",
-        "stop_watcher": "Stop file watcher? Automatic file processing will be disabled.",
-        "restart_watcher": "Restart file watcher? This will stop and restart automatic file processing.",
-    }
+    return _with_arg_context(tool_name, _base_confirmation_message(tool_name), tool_args)
+
 
-    base_message = messages.get(
-        tool_name,
-        f"Execute {tool_name}? This operation will modify data or trigger actions."
-    )
+# WRITE tools whose confirmation prompt is followed by the source path
+_SOURCE_CONTEXT_TOOLS = frozenset({"execute_ingest", "approve_queue_item"})
 
-    # Add context from arguments if available
-    if tool_name == "scan_library" and "library_name" in tool_args:
-        library = tool_args["library_name"] or "all libraries"
-        return f"Trigger scan for {library}? This will refresh Plex metadata."
 
-    if tool_name in ("execute_ingest", "approve_queue_item") and "source_path" in tool_args:
+def _with_arg_context(tool_name: str, base_message: str, tool_args: dict[str, Any]) -> str:
+    """Add argument-specific context to a base confirmation message."""
+    # f-strings compile to a single BUILD_STRING, so they're left inline rather
+    # than replaced with str.format_map templates (several times slower)
+    if tool_name == "scan_library":
+        if "library_name" in tool_args:
+            library = tool_args["library_name"] or "all libraries"
+            return f"Trigger scan for {library}? This will refresh Plex metadata."
+    elif tool_name in _SOURCE_CONTEXT_TOOLS and "source_path" in tool_args:
         return f"{base_message}\nSource: {tool_args['source_path']}"
 
     return base_message
@@ -179,21 +245,16 @@ def safety_hook(tool_name: str, tool_args: dict[str, Any]) -> dict[str, Any]:
             "confirmation_message": str | None  # Message for confirmation prompt
         }
     """
-    tier = classify_tool_safety(tool_name, tool_args)
-    allowed, reason = should_allow_operation(tier)
+    if tool_name in _BLOCKED_NAMES:
+        return dict(_BLOCKED_RESULT)
+    if tool_name in _READ_NAMES:
+        return dict(_READ_RESULT)
 
-    result = {
-        "tier": tier.value,
-        "allowed": allowed,
-        "reason": reason,
-        "requires_confirmation": tier == SafetyTier.WRITE,
-        "confirmation_message": None,
-    }
-
-    if tier == SafetyTier.WRITE:
-        result["confirmation_message"] = get_confirmation_message(tool_name, tool_args)
-
-    return result
+    entry = _SAFETY_TABLE.get(tool_name)
+    if entry is None:
+        # Unknown tools default to WRITE (safe default: require confirmation)
+        entry = _build_entry(tool_name, SafetyTier.WRITE)
+    return _result_for(entry, _with_arg_context(tool_name, entry[3], tool_args))
 
 
 # Example usage and testing